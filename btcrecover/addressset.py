@@ -20,7 +20,7 @@
 
 __version__ =  "1.10.0-CryptoGuide"
 
-import struct, base64, io, mmap, ast, itertools, sys, gc, glob, math
+import struct, io, mmap, ast, itertools, sys, gc, glob, math
 from os import path
 
 from datetime import datetime
@@ -45,14 +45,11 @@ def bytes_to_int(bytes_rep):
     """convert a string of bytes (in big-endian order) to an integer
 
     :param bytes_rep: the raw bytes
-    :type bytes_rep: str
+    :type bytes_rep: bytes
     :return: the unsigned integer
-    :rtype: int or long
+    :rtype: int
     """
-    bytes_len = len(bytes_rep)
-    if bytes_len <= 4:
-        return struct.unpack(">I", (4-bytes_len)*b"\0" + bytes_rep)[0]
-    return long(base64.b16encode(bytes_rep), 16)
+    return int.from_bytes(bytes_rep, "big")
 
 
 class AddressSet(object):
@@ -88,13 +85,14 @@ class AddressSet(object):
         self._max_len        = int(table_len * max_load)          # beyond this violates the load factor
         self._hash_bytes     = (table_len.bit_length() + 6) // 8  # number of bytes required for the mask
         self._hash_mask      = table_len - 1                      # mask used for the hash function
+        # (checked before the table is allocated, which for a large table_len can fail or take a while)
+        if self._bytes_per_addr + self._hash_bytes > 20:
+            raise ValueError("not enough bytes for both hashing and storage; "
+                             "reduce either the bytes_per_addr or table_len")
         self._data           = bytearray(self._table_bytes)       # the table itself
         self._dbfile         = None                               # file object, its .name is req'd for pickling
         self._mmap_access    = None                               # also required for pickling
         self.last_filenum    = None                               # will be serialized if set by the user
-        if self._bytes_per_addr + self._hash_bytes > 20:
-            raise ValueError("not enough bytes for both hashing and storage; "
-                             "reduce either the bytes_per_addr or table_len")
 
         if table_len > 1000 : #only display this if we are creating an addressDB
             # Print Timestamp that this step occured
@@ -133,9 +131,9 @@ class AddressSet(object):
         :coin: only used for formatting the text representation of the address (currently unused)
         """
 
-        #Check Address Type and convert to bytes if in str format. (Keeps unit tests working as-is in python 3)
+        #Check Address Type and convert to bytes if in str format (one char per byte, as in Python 2)
         if type(address) is str :
-            address = address.encode()
+            address = address.encode("latin-1")
 
         pos = self._find(address) #Check to see if the address is already in the addressDB
         if pos is not True: #If the address isn't in the DB, add it
@@ -171,20 +169,27 @@ class AddressSet(object):
     # (with high probability) only for invalid addresses (those w/o private keys).
     def _find(self, addr_to_find):
 
-        #Check Address Type and convert to bytes if in str format (Keeps unit tests working as-is in python 3)
+        #Check Address Type and convert to bytes if in str format (one char per byte, as in Python 2)
         if type(addr_to_find) is str :
-            addr_to_find = addr_to_find.encode()
-
-        pos = self._bytes_per_addr * (bytes_to_int(addr_to_find[ -self._hash_bytes :]) & self._hash_mask)
+            addr_to_find = addr_to_find.encode("latin-1")
+
+        # Copy some vars into local for a small speed boost
+        bytes_per_addr = self._bytes_per_addr
+        hash_bytes     = self._hash_bytes
+        data           = self._data
+        null_addr      = self._null_addr
+
+        pos = bytes_per_addr * (bytes_to_int(addr_to_find[ -hash_bytes :]) & self._hash_mask)
+        # Only the bytes_per_addr bytes before the "hash" are stored, so just those are compared
+        if len(addr_to_find) > bytes_per_addr:
+            addr_to_find = addr_to_find[ -(bytes_per_addr+hash_bytes) : -hash_bytes]
         while True:
-            cur_addr = self._data[pos : pos+self._bytes_per_addr]
-            if cur_addr == self._null_addr:
+            cur_addr = data[pos : pos+bytes_per_addr]
+            if cur_addr == null_addr:
                 return pos  # the position this element could be inserted at
-            if len(addr_to_find) > self._bytes_per_addr:
-                addr_to_find = addr_to_find[ -(self._bytes_per_addr+self._hash_bytes) : -self._hash_bytes]
             if cur_addr == addr_to_find:
                 return True
-            pos += self._bytes_per_addr  # linear probing
+            pos += bytes_per_addr  # linear probing
             if pos >= self._table_bytes:
                 pos = 0
 
@@ -335,7 +340,7 @@ def varint(data, offset):
         return struct.unpack_from("<Q", data, offset + 1)[0], offset + 9
     assert False
 
-def create_address_db(dbfilename, blockdir, table_len, startBlockDate="2019-01-01", endBlockDate="3000-12-31", startBlockFile = 0, addressDB_yolo = False, outputToText = False, update = False, progress_bar = True, addresslistfile = None, multiFile = False):
+def create_address_db(dbfilename, blockdir, table_len, startBlockDate="2019-01-01", endBlockDate="3000-12-31", startBlockFile = 0, addressDB_yolo = False, outputToText = False, update = False, progress_bar = True, addresslistfile = None, multiFile = False, bytes_per_addr = None):
     """Creates an AddressSet database and saves it to a file
 
     :param dbfilename: the file name where the database is saved (overwriting it)
@@ -346,11 +351,19 @@ def create_address_db(dbfilename, blockdir, table_len, startBlockDate="2019-01-0
     :type update: bool
     :param progress_bar: True to enable the progress bar
     :type progress_bar: bool
+    :param bytes_per_addr: number of bytes of each address to store (fewer makes for
+                           a smaller database, but with more false positives); defaults to 8,
+                           or when updating, to (and must match) the existing database's
+    :type bytes_per_addr: int
     """
 
     if update:
         print("Loading address database ...")
         address_set   = AddressSet.fromfile(open(dbfilename, "r+b"), mmap_access=mmap.ACCESS_WRITE)
+        if bytes_per_addr is not None and bytes_per_addr != address_set._bytes_per_addr:
+            address_set.close()
+            raise ValueError("can't change bytes_per_addr from {} to {} when updating an address database"
+                             .format(address_set._bytes_per_addr, bytes_per_addr))
         first_filenum = address_set.last_filenum
         print()
     else:
@@ -367,22 +380,23 @@ def create_address_db(dbfilename, blockdir, table_len, startBlockDate="2019-01-0
             raise ValueError("first block file '{}' doesn't exist in blocks directory '{}'".format(filename, blockdir))
 
     if not update:
-        # Open the file early to make sure we can, but don't overwrite it yet
-        # (see AddressSet.tofile() for why io.open() instead of open() is used)
-        try:
-            dbfile = io.open(dbfilename, "r+b")
-        except IOError:
-            dbfile = io.open(dbfilename, "wb")
-
         #Try to create the AddressDB. If the addresset is sufficiently large (eg: BTC) then this requires 64 bit python and will crash if attempted with 32 bit Python...
+        # (This is done before the file is opened, so an invalid table_len or bytes_per_addr doesn't leave an empty file behind)
         try:
             # With the default bytes_per_addr and max_load, this allocates
             # about 8 GiB which is room for a little over 800 million addresses (Required as of 2019)
-            address_set = AddressSet(1 << table_len)
+            address_set = AddressSet(1 << table_len, 8 if bytes_per_addr is None else bytes_per_addr)
         except OverflowError:
             print()
             exit("AddressDB too large for use with 32 bit Python. You will need to install a 64 bit (x64) version of Python 3 from python.org and try again")
 
+        # Open the file early to make sure we can, but don't overwrite it yet
+        # (see AddressSet.tofile() for why io.open() instead of open() is used)
+        try:
+            dbfile = io.open(dbfilename, "r+b")
+        except IOError:
+            dbfile = io.open(dbfilename, "wb")
+
     if addresslistfile:
         import btcrecover.btcrseed
         print("Initial AddressDB Contains", len(address_set), "Addresses")
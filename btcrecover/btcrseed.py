@@ -255,6 +255,20 @@ class WalletBase(object):
     def __init__(self, loading = False):
         assert loading, "use load_from_filename or create_from_params to create a " + self.__class__.__name__
 
+    # The number of addresses generated (per derivation path) when verifying a seed;
+    # it can be changed after the wallet has been created and configured
+    @property
+    def address_limit(self):
+        return getattr(self, "_addrs_to_generate", None)
+    #
+    @address_limit.setter
+    def address_limit(self, address_limit):
+        address_limit = int(address_limit)
+        if address_limit <= 0:
+            raise ValueError("the address limit must be > 0")
+        self._addrs_to_generate    = address_limit
+        self._passwords_per_second = None  # the speed estimate depends on the address limit
+
     @staticmethod
     def set_securityWarningsFlag(setflag):
         global disable_security_warnings
@@ -517,7 +531,7 @@ class WalletElectrum1(WalletBase):
             if (type(mnemonic_ids[0]) == str):
                 new_mnemonic_ids = []
                 for word in mnemonic_ids:
-                    new_mnemonic_ids.append(self._words.index(word))
+                    new_mnemonic_ids.append(self._word_to_id[word])
                 mnemonic_ids = new_mnemonic_ids
 
             # Compute the binary seed from the word list the Electrum1 way
@@ -935,30 +949,40 @@ class WalletBIP32(WalletBase):
 
         return False, len(mnemonic_ids_list)
 
+    # Derives the private key and chain code at the end of a BIP32 path (a list of its indexes)
+    # from a seed's bytes, returning them as a tuple of bytes
+    @staticmethod
+    def _derive_child_key(seed_bytes, path_indexes):
+        privkey_bytes = seed_bytes[:32]
+        chaincode_bytes = seed_bytes[32:]
+
+        for i in path_indexes:
+            if i < 2147483648:  # if it's a normal child key, derive the compressed public key
+                try: data_to_hmac = coincurve.PublicKey.from_valid_secret(privkey_bytes).format()
+                except ValueError: break
+            else:               # else it's a hardened child key
+                data_to_hmac = b"\0" + privkey_bytes  # prepended "\0" as per BIP32
+            data_to_hmac += struct.pack(">I", i)  # append the index (big-endian) as per BIP32
+
+            seed_bytes = hmac.new(chaincode_bytes, data_to_hmac, hashlib.sha512).digest()
+
+            # The child private key is the parent one + the first half of the seed_bytes (mod n)
+            privkey_bytes   = int_to_bytes((bytes_to_int(seed_bytes[:32]) +
+                                            bytes_to_int(privkey_bytes)) % GENERATOR_ORDER, 32)
+            chaincode_bytes = seed_bytes[32:]
+
+        return privkey_bytes, chaincode_bytes
+
     def _verify_seed(self, arg_seed_bytes, salt = None):
         if salt is None:
             salt = self._derivation_salts[0]
+        # Copy some vars into local for a small speed boost
+        l_sha256     = hashlib.sha256
+        hashlib_new  = hashlib.new
         # Derive the chain of private keys for the specified path as per BIP32
 
         for current_path_index in self._path_indexes:
-            seed_bytes = arg_seed_bytes
-            privkey_bytes = seed_bytes[:32]
-            chaincode_bytes = seed_bytes[32:]
-
-            for i in current_path_index:
-                if i < 2147483648:  # if it's a normal child key, derive the compressed public key
-                    try: data_to_hmac = coincurve.PublicKey.from_valid_secret(privkey_bytes).format()
-                    except ValueError: break
-                else:               # else it's a hardened child key
-                    data_to_hmac = b"\0" + privkey_bytes  # prepended "\0" as per BIP32
-                data_to_hmac += struct.pack(">I", i)  # append the index (big-endian) as per BIP32
-
-                seed_bytes = hmac.new(chaincode_bytes, data_to_hmac, hashlib.sha512).digest()
-
-                # The child private key is the parent one + the first half of the seed_bytes (mod n)
-                privkey_bytes   = int_to_bytes((bytes_to_int(seed_bytes[:32]) +
-                                                bytes_to_int(privkey_bytes)) % GENERATOR_ORDER, 32)
-                chaincode_bytes = seed_bytes[32:]
+            privkey_bytes, chaincode_bytes = self._derive_child_key(arg_seed_bytes, current_path_index)
 
             # If an extended public key was provided, check the derived chain code against it
             if self._chaincode:
@@ -973,10 +997,14 @@ class WalletBIP32(WalletBase):
                 try: data_to_hmac = coincurve.PublicKey.from_valid_secret(privkey_bytes).format()
                 except ValueError: break
                 privkey_int = bytes_to_int(privkey_bytes)
+                is_p2sh_segwit = (current_path_index[0] - 2**31)==49 or self.force_p2sh
+                # (every child's HMAC shares its key and prefix, so they're copied from this one)
+                parent_hmac = hmac.new(chaincode_bytes, data_to_hmac, hashlib.sha512)
 
                 for i in range(self._address_start_index, self._address_start_index + self._addrs_to_generate):
-                    seed_bytes = hmac.new(chaincode_bytes,
-                        data_to_hmac + struct.pack(">I", i), hashlib.sha512).digest()
+                    child_hmac = parent_hmac.copy()
+                    child_hmac.update(struct.pack(">I", i))
+                    seed_bytes = child_hmac.digest()
 
                     # The final derived private key is the parent one + the first half of the seed_bytes
                     d_privkey_bytes = int_to_bytes((bytes_to_int(seed_bytes[:32]) +
@@ -987,11 +1015,9 @@ class WalletBIP32(WalletBase):
 
                     test_hash160 = self.pubkey_to_hash160(d_pubkey) #Start off assuming that we have a standard BIP44 derivation path & address
 
-                    if((current_path_index[0] - 2**31)==49 or self.force_p2sh): #BIP49 Derivation Path & address
-                        pubkey_hash160 = self.pubkey_to_hash160(d_pubkey)
-                        WITNESS_VERSION = "\x00\x14"
-                        witness_program = WITNESS_VERSION.encode() + pubkey_hash160
-                        test_hash160 = hashlib.new("ripemd160", hashlib.sha256(witness_program).digest()).digest()
+                    if is_p2sh_segwit: #BIP49 Derivation Path & address (wraps the hash160 calculated above)
+                        witness_program = b"\x00\x14" + test_hash160
+                        test_hash160 = hashlib_new("ripemd160", l_sha256(witness_program).digest()).digest()
 
                     #Basic comparison content for Debugging
                     #for hash160 in self._known_hash160s:
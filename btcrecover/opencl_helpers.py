@@ -26,7 +26,20 @@ except:
 
 import btcrecover.btcrpass
 
+# The platforms and devices present don't change while running, so the best one (and its work
+# group size) is only chosen once; later calls just copy the previous choice to their wallet
+_auto_selected_platform = None
+
 def auto_select_opencl_platform(loaded_wallet):
+    global _auto_selected_platform
+    if not _auto_selected_platform:
+        _auto_selected_platform = _find_best_opencl_platform()
+
+    loaded_wallet.opencl_platform, loaded_wallet.opencl_device_worksize = _auto_selected_platform
+    print("OpenCL: Auto Selecting Best Platform")
+
+# Returns the number of the best platform present, and the largest work group size of its best device(s)
+def _find_best_opencl_platform():
     best_device_worksize = 0
     best_score_sofar = -1
     for i, platformNum in enumerate(pyopencl.get_platforms()):
@@ -49,9 +62,7 @@ def auto_select_opencl_platform(loaded_wallet):
                     if device.max_work_group_size > best_device_worksize:
                         best_device_worksize = device.max_work_group_size
 
-    loaded_wallet.opencl_platform = best_platform
-    loaded_wallet.opencl_device_worksize = best_device_worksize
-    print("OpenCL: Auto Selecting Best Platform")
+    return best_platform, best_device_worksize
 
 def init_opencl_contexts(loaded_wallet, openclDevice = 0):
     dklen = 64
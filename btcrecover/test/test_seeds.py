@@ -21,27 +21,98 @@
 # along with this program.  If not, see http://www.gnu.org/licenses/
 
 
-import warnings, unittest, os, tempfile, shutil, filecmp, sys, hashlib, random, mmap, pickle
+import warnings, contextlib, unittest, os, tempfile, shutil, sys, hashlib, mmap, pickle, itertools, functools, io, multiprocessing, copy, types
+import unittest.mock
 
 if __name__ == '__main__':
     sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 from btcrecover import btcrseed, btcrpass
-from btcrecover.addressset import AddressSet
+from btcrecover.addressset import AddressSet, create_address_db
 import btcrecover.opencl_helpers
 
 wallet_dir = os.path.join(os.path.dirname(__file__), "test-wallets")
 
-
-# def setUpModule():
-#     global orig_warnings
-#     orig_warnings = warnings.catch_warnings()
-#     orig_warnings.__enter__()  # save the current warnings settings (it's a context manager)
-#     # Convert warnings to errors:
-#     warnings.simplefilter("error")
-#
-#
-# def tearDownModule():
-#     orig_warnings.__exit__(None, None, None)  # restore the original warnings settings
+# Test mnemonics which are shared by many of the tests below
+ELEMENT_MNEMONIC = "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby"
+CERTAIN_MNEMONIC = "certain come keen collect slab gauge photo inside mechanic deny leader drop"
+BARREL_MNEMONIC  = "barrel tag debate reopen federal fee soda fog twelve garage sweet current"
+TALK_MNEMONIC    = "talk swamp tool right wide vital midnight cushion fiber blouse field transfer"
+ICE_MNEMONIC     = "ice stool great wine enough odor vocal crane owner magnet absent scare"
+
+# Where available (e.g. on Linux), the wallet files are copied into temporary directories (and
+# the AddressSet test files are created) on a RAM-backed filesystem, to avoid the disk (and any
+# on-access virus scanning) during the tests
+temp_dir_root = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+orig_pbkdf2_hmac = orig_derive_child_key = orig_load_pathlist = None
+# The first BIP39 reference test vector, as pbkdf2_hmac() arguments followed by the expected seed
+BIP39_PBKDF2_VECTOR = ("sha512", b"abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+                       b"mnemonicTREZOR", 2048, bytes.fromhex(
+                       "c55257c360c07c72029aebc1b53c05ed0362ada38ead3e3e9efa3708e53495531f09a6987599d18264c1e1c92f2cf141630c7a3c4ab7c81b2f001698e7463b04"))
+def setUpModule():
+    global orig_pbkdf2_hmac, orig_derive_child_key, orig_load_pathlist
+
+    # Probe for the optional hash modules once, up front; the skipUnless() checks below
+    # then just return the cached results (instead of probing while the tests are loaded)
+    can_load_groestlcoin_hash()
+    can_load_keccak()
+
+    # If the BTCR_TEST_FASTPBKDF2 environment variable is set to 1, the PBKDF2 used by the BIP39
+    # and Electrum2 wallets (which goes through hashlib.pbkdf2_hmac) is swapped for the faster
+    # fastpbkdf2 module while these tests run. If fastpbkdf2 isn't installed, hashlib's is used.
+    if os.environ.get("BTCR_TEST_FASTPBKDF2") == "1":
+        try:
+            import fastpbkdf2
+            orig_pbkdf2_hmac = hashlib.pbkdf2_hmac
+            hashlib.pbkdf2_hmac = fastpbkdf2.pbkdf2_hmac
+        except ImportError:
+            print("warning: BTCR_TEST_FASTPBKDF2 is set but fastpbkdf2 can't be loaded, using hashlib.pbkdf2_hmac",
+                  file=sys.stderr)
+
+        # Make sure the substituted PBKDF2 derives the same BIP39 seeds as the original one would
+        if orig_pbkdf2_hmac and hashlib.pbkdf2_hmac(*BIP39_PBKDF2_VECTOR[:-1]) != BIP39_PBKDF2_VECTOR[-1]:
+            hashlib.pbkdf2_hmac = orig_pbkdf2_hmac
+            raise AssertionError("fastpbkdf2.pbkdf2_hmac failed the BIP39 test vector")
+
+    # Many of the address, MPK and AddressDB tests share both a mnemonic (and so its seed) and
+    # a derivation path (e.g. m/44'/0'/0'/0), so cache the private key and chain code derived at
+    # the end of each path; only the final address index derivations are then repeated
+    orig_derive_child_key   = btcrseed.WalletBIP32._derive_child_key
+    cached_derive_child_key = functools.lru_cache(maxsize=256)(orig_derive_child_key)
+    btcrseed.WalletBIP32._derive_child_key = staticmethod(
+        lambda seed_bytes, path_indexes: cached_derive_child_key(seed_bytes, tuple(path_indexes)))
+
+    # Every wallet created without a path reads its coin's default derivationpath-lists file,
+    # as do the pathlist_file tests, so each file is only read and parsed once (callers still
+    # each get a new list, just as they would from the uncached load_pathlist())
+    orig_load_pathlist   = btcrseed.load_pathlist
+    cached_load_pathlist = functools.lru_cache(maxsize=None)(lambda pathlist_file: tuple(orig_load_pathlist(pathlist_file)))
+    btcrseed.load_pathlist = lambda pathlist_file: list(cached_load_pathlist(pathlist_file))
+
+
+def tearDownModule():
+    if orig_pbkdf2_hmac:
+        # btcrpass.load_pbkdf2_library() may have picked up fastpbkdf2's version while it was in place
+        if getattr(btcrpass, "pbkdf2_hmac", None) is hashlib.pbkdf2_hmac:
+            btcrpass.pbkdf2_hmac = orig_pbkdf2_hmac
+        hashlib.pbkdf2_hmac = orig_pbkdf2_hmac
+    if orig_derive_child_key:
+        btcrseed.WalletBIP32._derive_child_key = staticmethod(orig_derive_child_key)
+    if orig_load_pathlist:
+        btcrseed.load_pathlist = orig_load_pathlist
+
+
+# Converts warnings into errors, but only for the code run inside the with statement (typically
+# just the mnemonic verification) rather than for the whole module (which also imports and
+# loads third-party libraries which can emit spurious warnings)
+@contextlib.contextmanager
+def strict_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        # Some OpenSSL builds treat RIPEMD-160 as a legacy algorithm
+        warnings.filterwarnings("ignore", message=".*ripemd160.*")
+        yield
 
 
 opencl_device_count = None
@@ -90,19 +161,75 @@ def skipUnless(condition_func, reason):
     return decorator
 
 
+# Returns a digest of a file's entire contents; the digests of the (unchanging) original
+# test wallets are cached so that each is only read once, no matter how many tests use it
+wallet_digests = {}
+def file_digest(filename, cache = False):
+    if cache and filename in wallet_digests:
+        return wallet_digests[filename]
+    with open(filename, "rb") as file:
+        digest = hashlib.blake2b(file.read(), digest_size=16).digest()
+    if cache:
+        wallet_digests[filename] = digest
+    return digest
+
+
+# Returns the next count items from an iterator (e.g. a wallet's performance_iterator()) as
+# a tuple, ready to be verified in a single call to return_verified_password_or_false()
+def next_batch(iterator, count):
+    return tuple(itertools.islice(iterator, count))
+
+
+# The bulk of the time spent in each tester below is in config_mnemonic() (finding close
+# words with difflib), not in verifying the mnemonic, and most tests reuse one of a handful
+# of mnemonics. This caches the module globals and wallet attributes which config_mnemonic()
+# produces, and restores them onto later wallets of the same type configured the same way.
+# close_mnemonic_ids is a snapshot (copied in and out) so later changes to it can't reach the cache.
+_config_mnemonic_cache = {}
+def config_mnemonic_cached(wallet, mnemonic, **kwds):
+    key = (type(wallet), mnemonic, repr(sorted(kwds.items())),
+           getattr(wallet, "_needs_passphrase", None), getattr(wallet, "_passphrase_recovery", None))
+    cached = _config_mnemonic_cache.get(key)
+
+    if cached is None:
+        attrs_before = dict(wallet.__dict__)
+        wallet.config_mnemonic(mnemonic, **kwds)
+        cached = _config_mnemonic_cache[key] = (
+            (btcrseed.mnemonic_ids_guess, copy.deepcopy(btcrseed.close_mnemonic_ids), btcrseed.num_inserts, btcrseed.num_deletes),
+            {name: value for name, value in wallet.__dict__.items()
+             if name not in attrs_before or attrs_before[name] is not value})
+        return
+
+    mnemonic_globals, wallet_attrs = cached
+    btcrseed.mnemonic_ids_guess, close_mnemonic_ids, btcrseed.num_inserts, btcrseed.num_deletes = mnemonic_globals
+    btcrseed.close_mnemonic_ids = copy.deepcopy(close_mnemonic_ids)
+    wallet.__dict__.update(wallet_attrs)
+
+
+# Registers the auto-detecting wallets unless they're already registered in this process
+# (btcrpass.clear_registered_wallets() replaces btcrpass.wallet_types, undoing it)
+registered_wallet_types = None
+def register_autodetecting_wallets_once():
+    global registered_wallet_types
+    if btcrpass.wallet_types is not registered_wallet_types:
+        btcrseed.register_autodetecting_wallets()
+        registered_wallet_types = btcrpass.wallet_types
+
+
 class TestRecoveryFromWallet(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        btcrseed.register_autodetecting_wallets()
+        register_autodetecting_wallets_once()
 
     # Checks a test wallet against the known mnemonic, and ensures
     # that the library doesn't make any changes to the wallet file
     def wallet_tester(self, wallet_basename, correct_mnemonic, **kwds):
         assert os.path.basename(wallet_basename) == wallet_basename
         wallet_filename = os.path.join(wallet_dir, wallet_basename)
+        wallet_digest   = file_digest(wallet_filename, cache=True)
 
-        temp_dir = tempfile.mkdtemp("-test-btcr")
+        temp_dir = tempfile.mkdtemp("-test-btcr", dir=temp_dir_root)
         try:
             temp_wallet_filename = os.path.join(temp_dir, wallet_basename)
             shutil.copyfile(wallet_filename, temp_wallet_filename)
@@ -110,21 +237,21 @@ class TestRecoveryFromWallet(unittest.TestCase):
             wallet = btcrseed.btcrpass.load_wallet(temp_wallet_filename)
 
             # Convert the mnemonic string into a mnemonic_ids_guess
-            wallet.config_mnemonic(correct_mnemonic, **kwds)
+            config_mnemonic_cached(wallet, correct_mnemonic, **kwds)
             correct_mnemonic = btcrseed.mnemonic_ids_guess
 
             # Creates wrong mnemonic id guesses
-            wrong_mnemonic_iter = wallet.performance_iterator()
+            wrong_mnemonic_ids = next_batch(wallet.performance_iterator(), 4)
 
-            self.assertEqual(wallet.return_verified_password_or_false(
-                (wrong_mnemonic_iter.__next__(), wrong_mnemonic_iter.__next__())), (False, 2))
-            self.assertEqual(wallet.return_verified_password_or_false(
-                (wrong_mnemonic_iter.__next__(), correct_mnemonic, wrong_mnemonic_iter.__next__())),
-                (correct_mnemonic, 2))
+            with strict_warnings():
+                self.assertEqual(wallet.return_verified_password_or_false(
+                    wrong_mnemonic_ids[:2]), (False, 2))
+                self.assertEqual(wallet.return_verified_password_or_false(
+                    (wrong_mnemonic_ids[2], correct_mnemonic, wrong_mnemonic_ids[3])),
+                    (correct_mnemonic, 2))
 
             del wallet
-            self.assertTrue(
-                filecmp.cmp(wallet_filename, temp_wallet_filename, False))  # False == always compare file contents
+            self.assertEqual(file_digest(temp_wallet_filename), wallet_digest)
         finally:
             shutil.rmtree(temp_dir)
 
@@ -162,16 +289,17 @@ class TestRecoveryFromMPK(unittest.TestCase):
             wallet = wallet_type.create_from_params(mpk=the_mpk, path=[test_path])
 
         # Convert the mnemonic string into a mnemonic_ids_guessde
-        wallet.config_mnemonic(correct_mnemonic, **kwds)
+        config_mnemonic_cached(wallet, correct_mnemonic, **kwds)
         correct_mnemonic = btcrseed.mnemonic_ids_guess
 
         # Creates wrong mnemonic id guesses
-        wrong_mnemonic_iter = wallet.performance_iterator()
+        wrong_mnemonic_ids = next_batch(wallet.performance_iterator(), 4)
 
-        self.assertEqual(wallet.return_verified_password_or_false(
-            (wrong_mnemonic_iter.__next__(), wrong_mnemonic_iter.__next__())), (False, 2))
-        self.assertEqual(wallet.return_verified_password_or_false(
-            (wrong_mnemonic_iter.__next__(), correct_mnemonic, wrong_mnemonic_iter.__next__())), (correct_mnemonic, 2))
+        with strict_warnings():
+            self.assertEqual(wallet.return_verified_password_or_false(
+                wrong_mnemonic_ids[:2]), (False, 2))
+            self.assertEqual(wallet.return_verified_password_or_false(
+                (wrong_mnemonic_ids[2], correct_mnemonic, wrong_mnemonic_ids[3])), (correct_mnemonic, 2))
 
     def test_electrum1_xpub_legacy(self):
         self.mpk_tester(btcrseed.WalletElectrum1,
@@ -246,20 +374,20 @@ class TestRecoveryFromMPK(unittest.TestCase):
         # an xpub at path m/44'/0'/0', as any native segwit BIP39 wallet would export
         self.mpk_tester(btcrseed.WalletBIP39,
                         "xpub6BgCDhMefYxRS1gbVbxyokYzQji65v1eGJXGEiGdoobvFBShcNeJt97zoJBkNtbASLyTPYXJHRvkb3ahxaVVGEtC1AD4LyuBXULZcfCjBZx",
-                        "certain come keen collect slab gauge photo inside mechanic deny leader drop")
+                        CERTAIN_MNEMONIC)
 
     def test_bip39_ypub(self):
         # an ypub at path m/49'/0'/0', as any native segwit BIP39 wallet would export
         self.mpk_tester(btcrseed.WalletBIP39,
                         "ypub6X4G7a9RYWheXmmhfrMR8Nt5XeThiupghvdiYyZFsRWUKKSfzamAUM66Ay9P8XsD7asG6PqSBBDbGihKQndHfgkg2HnHfx2fN69AYzpcxVT",
-                        "ice stool great wine enough odor vocal crane owner magnet absent scare",
+                        ICE_MNEMONIC,
                         "m/49'/0'/0'/0")
 
     def test_bip39_zpub(self):
         # an zpub at path m/84'/0'/0', as any native segwit BIP39 wallet would export
         self.mpk_tester(btcrseed.WalletBIP39,
                         "zpub6rpXnwsvpxao28enE4M3xMbHuEkMfhqQc3o1uXp8pBYUA7wG2Ez4SBDFJCWJr3vaP2ysauHX6f68iWzVBzWMkc4BBz9DhFZ9MpKVZHGBLKo",
-                        "ice stool great wine enough odor vocal crane owner magnet absent scare",
+                        ICE_MNEMONIC,
                         "m/84'/0'/0'/0")
 
     def test_bip44_firstfour(self):
@@ -278,14 +406,14 @@ class TestRecoveryFromMPK(unittest.TestCase):
         # an xpub at path m/44'/0'/0', as Mycelium for Android would export
         self.mpk_tester(btcrseed.WalletBIP39,
                         "xpub6D3uXJmdUg4xVnCUkNXJPCkk18gZAB8exGdQeb2rDwC5UJtraHHARSCc2Nz7rQ14godicjXiKxhUn39gbAw6Xb5eWb5srcbkhqPgAqoTMEY",
-                        "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                        CERTAIN_MNEMONIC,
                         passphrases=[u"btcr-test-password",])
 
     def test_bip44_pass_unicode(self):
         # an xpub at path m/44'/0'/0', as Mycelium for Android would export
         self.mpk_tester(btcrseed.WalletBIP39,
                         "xpub6CZe1G1A1CaaSepbekLMSk1sBRNA9kHZzEQCedudHAQHHB21FW9fYpQWXBevrLVQfL8JFQVFWEw3aACdr6szksaGsLiHDKyRd1rPJ6ev5ig",
-                        "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                        CERTAIN_MNEMONIC,
                         passphrases=[u"btcr-тест-пароль",])
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
@@ -300,7 +428,7 @@ class TestRecoveryFromMPK(unittest.TestCase):
         # an xpub at path m/44'/17'/0', as any native segwit BIP39 wallet would export
         self.mpk_tester(btcrseed.WalletBIP39,
                         "xpub6FPF487W2VhCCKBUXuSAVtSTe8MxEJikuQTxicJxfHHAZbBQLsGHNdCYCHEbNmpzaXMvJWKQ6y93BtXSkte2oRmtvuYbm8bKcUUL5LCuQbo",
-                        "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                        CERTAIN_MNEMONIC,
                         "m/44'/17'/0'/0")
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
@@ -308,7 +436,7 @@ class TestRecoveryFromMPK(unittest.TestCase):
         # an ypub at path m/49'/17'/0', as any native segwit BIP39 wallet would export
         self.mpk_tester(btcrseed.WalletBIP39,
                         "ypub6YwUoVLhxxKrNrvireT1onpSWXFRGvp4kHGceUqhK8Xja99tGAdmQqUSQceyGMAhK1c5mnFKMVUBokmS2Ka2C2jRTGZrm4nHzxVyDM48egV",
-                        "ice stool great wine enough odor vocal crane owner magnet absent scare",
+                        ICE_MNEMONIC,
                         "m/49'/17'/0'/0")
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
@@ -316,17 +444,22 @@ class TestRecoveryFromMPK(unittest.TestCase):
         # an zpub at path m/84'/17'/0', as any native segwit BIP39 wallet would export
         self.mpk_tester(btcrseed.WalletBIP39,
                         "zpub6u5Ro8kyXwV3zueN2G8fUwJ1hHAjYN6Ld1VCK9KGMw6m2R5M8ZtqBCrp6aQXZVh9cJWGvSm4J8mBwSsYboYfR5Ybsv8LeSYYWQk5ZhHJE4a",
-                        "ice stool great wine enough odor vocal crane owner magnet absent scare",
+                        ICE_MNEMONIC,
                         "m/84'/17'/0'/0")
 
 
+# lib.eth_hash only wraps C Keccak implementations (pycryptodome's, else pysha3's), and
+# it doesn't choose one until its first use, hence the test hash of b'' below
 is_sha3_loadable = None
+keccak_backend   = None  # the name of the backend chosen by lib.eth_hash (reported on failure)
 
 
 def can_load_keccak():
-    global is_sha3_loadable
+    global is_sha3_loadable, keccak_backend
     if is_sha3_loadable is None:
         try:
+            from lib.eth_hash.utils import auto_choose_backend
+            keccak_backend = auto_choose_backend().__name__.rpartition(".")[2]
             from lib.eth_hash.auto import keccak
             keccak(b'')
             is_sha3_loadable = True
@@ -335,6 +468,18 @@ def can_load_keccak():
     return is_sha3_loadable
 
 
+# Skips an Ethereum test unless a Keccak backend is available, and names the backend in any failure
+def skipUnlessKeccak(test_func):
+    @skipUnless(can_load_keccak, "requires pycryptodome or pysha3")
+    def test_with_keccak(self):
+        try:
+            test_func(self)
+        except AssertionError as e:
+            raise AssertionError("{} (using the {} Keccak backend)".format(e, keccak_backend)) from e
+
+    return test_with_keccak
+
+
 class TestRecoveryFromAddress(unittest.TestCase):
 
     @classmethod
@@ -343,6 +488,11 @@ class TestRecoveryFromAddress(unittest.TestCase):
             hashlib.new("ripemd160")
         except ValueError:
             raise unittest.SkipTest("requires that hashlib implements RIPEMD-160")
+        # OpenSSL picks the fastest SHA-256 implementation the CPU supports (e.g. SHA-NI or the
+        # ARMv8 SHA2 extensions), whereas Python's fallback implementation is much slower
+        if type(hashlib.sha256()).__module__ != "_hashlib":
+            print("warning: hashlib.sha256 is not provided by OpenSSL, address tests will run slowly",
+                  file=sys.stderr)
 
     def address_tester(self, wallet_type, the_address, the_address_limit, correct_mnemonic, test_path=None,
                        pathlist_file=None, addr_start_index = 0, force_p2sh = False, **kwds):
@@ -365,28 +515,43 @@ class TestRecoveryFromAddress(unittest.TestCase):
                                                     path=test_path)
 
         # Convert the mnemonic string into a mnemonic_ids_guess
-        wallet.config_mnemonic(correct_mnemonic, **kwds)
+        config_mnemonic_cached(wallet, correct_mnemonic, **kwds)
         correct_mnemonic_ids = btcrseed.mnemonic_ids_guess
 
         # Creates wrong mnemonic id guesses
-        wrong_mnemonic_iter = wallet.performance_iterator()
+        wrong_mnemonic_ids = next_batch(wallet.performance_iterator(), 4)
 
-        self.assertEqual(wallet.return_verified_password_or_false(
-            (wrong_mnemonic_iter.__next__(), wrong_mnemonic_iter.__next__())), (False, 2))
-        self.assertEqual(wallet.return_verified_password_or_false(
-            (wrong_mnemonic_iter.__next__(), correct_mnemonic_ids, wrong_mnemonic_iter.__next__())),
-            (correct_mnemonic_ids, 2))
+        with strict_warnings():
+            self.assertEqual(wallet.return_verified_password_or_false(
+                wrong_mnemonic_ids[:2]), (False, 2))
+            self.assertEqual(wallet.return_verified_password_or_false(
+                (wrong_mnemonic_ids[2], correct_mnemonic_ids, wrong_mnemonic_ids[3])),
+                (correct_mnemonic_ids, 2))
 
         # Make sure the address_limit is respected (note the "the_address_limit-1" below)
-        if test_path == None:
-            wallet = wallet_type.create_from_params(addresses=[the_address], address_limit=the_address_limit - 1)
-        else:
-            wallet = wallet_type.create_from_params(addresses=[the_address], address_limit=the_address_limit - 1,
-                                                    path=test_path)
-
-        wallet.config_mnemonic(correct_mnemonic, **kwds)
-        self.assertEqual(wallet.return_verified_password_or_false(
-            (correct_mnemonic_ids,)), (False, 1))
+        wallet.address_limit = the_address_limit - 1
+        with strict_warnings():
+            self.assertEqual(wallet.return_verified_password_or_false(
+                (correct_mnemonic_ids,)), (False, 1))
+
+    def test_config_mnemonic_cached(self):
+        mnemonic = CERTAIN_MNEMONIC
+        create_wallet = lambda: btcrseed.WalletBIP39.create_from_params(
+            addresses=["1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3"], address_limit=2)
+        config_mnemonic_cached(create_wallet(), mnemonic)
+        cached_wallet = create_wallet()
+        config_mnemonic_cached(cached_wallet, mnemonic)
+        cached_globals = (btcrseed.mnemonic_ids_guess, btcrseed.close_mnemonic_ids, btcrseed.num_inserts, btcrseed.num_deletes)
+
+        live_wallet = create_wallet()
+        live_wallet.config_mnemonic(mnemonic)
+        self.assertEqual(cached_globals,
+            (btcrseed.mnemonic_ids_guess, btcrseed.close_mnemonic_ids, btcrseed.num_inserts, btcrseed.num_deletes))
+        self.assertEqual(cached_wallet._derivation_salts, live_wallet._derivation_salts)
+        self.assertEqual(cached_wallet._word_to_binary, live_wallet._word_to_binary)
+        self.assertEqual(cached_wallet._checksum_ratio, live_wallet._checksum_ratio)
+        self.assertEqual(cached_wallet.return_verified_password_or_false((btcrseed.mnemonic_ids_guess,)),
+                         live_wallet.return_verified_password_or_false((btcrseed.mnemonic_ids_guess,)))
 
     def test_electrum1_addr_legacy_BTC(self):
         self.address_tester(btcrseed.WalletElectrum1, "12zAz6pAB6LhzGSZFCc6g9uBSWzwESEsPT", 3,
@@ -429,7 +594,7 @@ class TestRecoveryFromAddress(unittest.TestCase):
 
     def test_bip44_addr_BTC_defaultderivationpaths(self):
         self.address_tester(btcrseed.WalletBIP39, "1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop", )
+                            CERTAIN_MNEMONIC, )
 
     def test_bip44_addr_BTC_passphraseList(self):
         testPassphrases = btcrseed.load_passphraselist("./btcrecover/test/test-listfiles/BIP39PassphraseListTest.txt")
@@ -438,8 +603,7 @@ class TestRecoveryFromAddress(unittest.TestCase):
 
     def test_bip49_addr_BTC_defaultderivationpaths(self):
         self.address_tester(btcrseed.WalletBIP39, "3NiRFNztVLMZF21gx6eE1nL3Q57GMGuunG", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate "
-                            "sister uniform advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_p2sh_addr_BTC_forceP2SH(self):
         self.address_tester(btcrseed.WalletBIP39, "37WQFyiQkMTcbzWfmWGRxD92EcnTvwiTDg", 2,
@@ -448,254 +612,221 @@ class TestRecoveryFromAddress(unittest.TestCase):
 
     def test_bip49_addr_BTC_force_start_index(self):
         self.address_tester(btcrseed.WalletBIP39, "3MtDzhXzsSSkn49WdYCno7o5ZqAVxsFmqj", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate "
-                            "sister uniform advice pen praise soap lizard festival connect baby", addr_start_index = 18)
+                            ELEMENT_MNEMONIC, addr_start_index = 18)
 
     def test_bip84_addr_BTC_defaultderivationpaths(self):
         self.address_tester(btcrseed.WalletBIP39, "bc1qv87qf7prhjf2ld8vgm7l0mj59jggm6ae5jdkx2", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate "
-                            "sister uniform advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_bip44_addr_XRP(self):
         self.address_tester(btcrseed.WalletBIP39, "rJGNUmwiYDwXEsLzUFV9njhP3syrDvA6hs", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                            CERTAIN_MNEMONIC,
                             ["m/44'/144'/0'/0"])
 
     def test_bip44_addr_BTC(self):
         self.address_tester(btcrseed.WalletBIP39, "1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                            CERTAIN_MNEMONIC,
                             ["m/44'/0'/0'/0"])
 
     def test_bip44_addr_BTC_multi_coin_derivationpaths(self):
         self.address_tester(btcrseed.WalletBIP39, "1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                            CERTAIN_MNEMONIC,
                             ["m/44'/4'/0'/0","m/44'/3'/0'/0","m/44'/2'/0'/0","m/44'/1'/0'/0","m/44'/0'/0'/0"])
 
     def test_bip44_addr_BTC_multi_account_derivationpaths(self):
         self.address_tester(btcrseed.WalletBIP39, "1Bi4fRZTPna1nbBJ8KLxaFfWV3BFDV9xj3", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                            CERTAIN_MNEMONIC,
                             ["m/44'/0'/0'/0","m/44'/0'/1'/0","m/44'/0'/2'/0","m/44'/0'/3'/0","m/44'/0'/4'/0"])
 
     def test_bip49_addr_BTC(self):
         self.address_tester(btcrseed.WalletBIP39, "3NiRFNztVLMZF21gx6eE1nL3Q57GMGuunG", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/49'/0'/0'/0"])
 
     def test_bip84_addr_BTC(self):
         self.address_tester(btcrseed.WalletBIP39, "bc1qv87qf7prhjf2ld8vgm7l0mj59jggm6ae5jdkx2", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/84'/0'/0'/0"])
 
     def test_bip44_addr_LTC(self):
         self.address_tester(btcrseed.WalletBIP39, "LhHbcBk84JpB41otvD7qqWzyGgyr8yDJ2a", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/44'/2'/0'/0"])
 
     def test_bip49_addr_LTC(self):
         self.address_tester(btcrseed.WalletBIP39, "MQT8szKNYyJU1hUPLnsfCYXkqLQbTewsj9", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/49'/2'/0'/0"])
 
     def test_bip84_addr_LTC(self):
         self.address_tester(btcrseed.WalletBIP39, "ltc1q2dzc0u75p5aule30w5t5hjdzhgh2kmgqyh2t0f", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/84'/2'/0'/0"])
 
     def test_bip44_addr_VTC(self):
         self.address_tester(btcrseed.WalletBIP39, "VwrYFHeKbneYZdkPWTpXsUs3ZQ4ERan9tG", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/44'/28'/0'/0"])
 
     def test_bip49_addr_VTC(self):
         self.address_tester(btcrseed.WalletBIP39, "33DUUsVoodofnbrxFhqCSBkKaqjCHzQyYU", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/49'/28'/0'/0"])
 
     def test_bip84_addr_VTC(self):
         self.address_tester(btcrseed.WalletBIP39, "vtc1q4r6d6w0xnd4t2rlj8njcl7m7a9k0ezk9rjnc77", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/84'/28'/0'/0"])
 
     def test_bip44_addr_MONA(self):
         self.address_tester(btcrseed.WalletBIP39, "M9BBjQC5vWktdbrfZZorybzUY75wtNB7JC", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/44'/22'/0'/0"])
 
     def test_bip49_addr_MONA(self):
         self.address_tester(btcrseed.WalletBIP39, "P8gv2vrMyVhDdjHgJf6yxH3vGarM9fCZ9f", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/49'/22'/0'/0"])
 
     def test_bip84_addr_MONA(self):
         self.address_tester(btcrseed.WalletBIP39, "monacoin1q9v93ngm8srxtq7lwzypehax7xvewh2vch68m2f", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/84'/22'/0'/0"])
 
     def test_bip44_addr_DGB(self):
         self.address_tester(btcrseed.WalletBIP39, "D8uui9mGXztcpZy5t5jWpSimCCyEDjYRHY", 5,
-                            "barrel tag debate reopen federal fee soda fog twelve garage sweet current",
+                            BARREL_MNEMONIC,
                             ["m/44'/20'/0'/0"])
 
     def test_bip49_addr_DGB(self):
         self.address_tester(btcrseed.WalletBIP39, "SjM4p9vWB7GvsiNMgyZef67SJz3SgmPwhj", 5,
-                            "barrel tag debate reopen federal fee soda fog twelve garage sweet current",
+                            BARREL_MNEMONIC,
                             ["m/49'/20'/0'/0"])
 
     def test_bip84_addr_DGB(self):
         self.address_tester(btcrseed.WalletBIP39, "dgb1qmtpcmpt5amuvvwvpelh220ec2ck7q4prsy2tqy", 5,
-                            "barrel tag debate reopen federal fee soda fog twelve garage sweet current",
+                            BARREL_MNEMONIC,
                             ["m/84'/20'/0'/0"])
 
     def test_bip44_addr_BCH_CashAddr(self):
         self.address_tester(btcrseed.WalletBIP39, "bitcoincash:qrdupm96x04u3ssjnuj7lpy7adt9y34p5vzh95y0y7", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/44'/145'/0'/0"])
 
     def test_bip44_addr_BCH_CashAddr_NoPrefix(self):
         self.address_tester(btcrseed.WalletBIP39, "qrdupm96x04u3ssjnuj7lpy7adt9y34p5vzh95y0y7", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/44'/145'/0'/0"])
 
     def test_bip44_addr_DASH(self):
         self.address_tester(btcrseed.WalletBIP39, "XkRVBsXz1UG7LP48QKT4ZEbyUS54oRjYpM", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/44'/5'/0'/0"])
 
     def test_bip44_addr_DOGE(self):
         self.address_tester(btcrseed.WalletBIP39, "DANb1e9B2WtHJNDJUsiu1fTrtAzGJhqkPa", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/44'/3'/0'/0"])
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
     def test_bip44_addr_GRS(self):
         self.address_tester(btcrseed.WalletBIP39, "FqGMQvKCb2idGbDd6SUBFuugynXRACEzuQ", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/44'/17'/0'/0"])
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
     def test_bip49_addr_GRS(self):
         self.address_tester(btcrseed.WalletBIP39, "384swZndJ7CjZhqx7JL29Whnommy9s9phF", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/49'/17'/0'/0"])
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
     def test_bip84_addr_GRS(self):
         self.address_tester(btcrseed.WalletBIP39, "grs1qy9qewq3x843gss8z6h22gmc03gfzuuj7hz505a", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             ["m/84'/17'/0'/0"])
 
-    @unittest.skipUnless(can_load_keccak(), "requires pycryptodome")
+    @skipUnlessKeccak
     def test_ethereum_addr(self):
         self.address_tester(btcrseed.WalletEthereum, "0x9544a5BD7D9AACDc0A12c360C1ec6182C84bab11", 3,
                             "cable top mango offer mule air lounge refuse stove text cattle opera")
 
     # tests for a bug affecting certain seeds/wallets in v0.7.1
-    @unittest.skipUnless(can_load_keccak(), "requires pycryptodome")
+    @skipUnlessKeccak
     def test_ethereum_addr_padding_bug(self):
         self.address_tester(btcrseed.WalletEthereum, "0xaeaa91ba7235dc2d90e28875d3e466aaa27e076d", 2,
                             "appear section card oak mercy output person grab rotate sort where rural")
 
     def test_walletripple_bip44(self):
         self.address_tester(btcrseed.WalletRipple, "rJGNUmwiYDwXEsLzUFV9njhP3syrDvA6hs", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop")
+                            CERTAIN_MNEMONIC)
 
     def test_walletvertcoin_addr_bip44(self):
         self.address_tester(btcrseed.WalletVertcoin, "VwrYFHeKbneYZdkPWTpXsUs3ZQ4ERan9tG", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletvertcoin_addr_bip49(self):
         self.address_tester(btcrseed.WalletVertcoin, "33DUUsVoodofnbrxFhqCSBkKaqjCHzQyYU", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletvertcoin_addr_bip84(self):
         self.address_tester(btcrseed.WalletVertcoin, "vtc1q4r6d6w0xnd4t2rlj8njcl7m7a9k0ezk9rjnc77", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletmonacoin_addr_bip44(self):
         self.address_tester(btcrseed.WalletMonacoin, "M9BBjQC5vWktdbrfZZorybzUY75wtNB7JC", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletmonacoin_addr_bip49(self):
         self.address_tester(btcrseed.WalletMonacoin, "P8gv2vrMyVhDdjHgJf6yxH3vGarM9fCZ9f", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletmonacoin_addr_bip84(self):
         self.address_tester(btcrseed.WalletMonacoin, "monacoin1q9v93ngm8srxtq7lwzypehax7xvewh2vch68m2f", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletdigibyte_addr_bip44(self):
         self.address_tester(btcrseed.WalletDigiByte, "D8uui9mGXztcpZy5t5jWpSimCCyEDjYRHY", 5,
-                            "barrel tag debate reopen federal fee soda fog twelve garage sweet current")
+                            BARREL_MNEMONIC)
 
     def test_walletdigibyte_addr_bip49(self):
         self.address_tester(btcrseed.WalletDigiByte, "SjM4p9vWB7GvsiNMgyZef67SJz3SgmPwhj", 5,
-                            "barrel tag debate reopen federal fee soda fog twelve garage sweet current")
+                            BARREL_MNEMONIC)
 
     def test_walletdigibyte_addr_bip84(self):
         self.address_tester(btcrseed.WalletDigiByte, "dgb1qmtpcmpt5amuvvwvpelh220ec2ck7q4prsy2tqy", 5,
-                            "barrel tag debate reopen federal fee soda fog twelve garage sweet current")
+                            BARREL_MNEMONIC)
 
     def test_walletbch_addr_bip44_CashAddr(self):
         self.address_tester(btcrseed.WalletBCH, "bitcoincash:qrdupm96x04u3ssjnuj7lpy7adt9y34p5vzh95y0y7", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletbch_addr_bip44_CashAddr_NoPrefix(self):
         self.address_tester(btcrseed.WalletBCH, "qrdupm96x04u3ssjnuj7lpy7adt9y34p5vzh95y0y7", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletdash_addr_bip44(self):
         self.address_tester(btcrseed.WalletDash, "XkRVBsXz1UG7LP48QKT4ZEbyUS54oRjYpM", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletdogecoin_addr_bip44(self):
         self.address_tester(btcrseed.WalletDogecoin, "DANb1e9B2WtHJNDJUsiu1fTrtAzGJhqkPa", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
     def test_walletgroestlecoin_addr_bip44(self):
         self.address_tester(btcrseed.WalletGroestlecoin, "FqGMQvKCb2idGbDd6SUBFuugynXRACEzuQ", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
     def test_walletgroestlecoin_addr_bip49(self):
         self.address_tester(btcrseed.WalletGroestlecoin, "384swZndJ7CjZhqx7JL29Whnommy9s9phF", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
     def test_walletgroestlecoin_addr_bip84(self):
         self.address_tester(btcrseed.WalletGroestlecoin, "grs1qy9qewq3x843gss8z6h22gmc03gfzuuj7hz505a", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform "
-                            "advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletzilliqa_addr_legacy(self):
         self.address_tester(btcrseed.WalletZilliqa, "0x61cac31f637fa3a7e7b0984efe930cddf2070171", 3,
@@ -707,8 +838,7 @@ class TestRecoveryFromAddress(unittest.TestCase):
 
     def test_walletlitecoin_addr_bip44(self):
         self.address_tester(btcrseed.WalletLitecoin, "LhHbcBk84JpB41otvD7qqWzyGgyr8yDJ2a", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate"
-                            " sister uniform advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletlitecoin_addr_atomic(self):
         self.address_tester(btcrseed.WalletLitecoin, "LZzJsDgidaRQXicyd5Rb2LbRZd5SR6QqrS", 2,
@@ -716,21 +846,19 @@ class TestRecoveryFromAddress(unittest.TestCase):
 
     def test_walletlitecoin_addr_bip49(self):
         self.address_tester(btcrseed.WalletLitecoin, "MQT8szKNYyJU1hUPLnsfCYXkqLQbTewsj9", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate"
-                            " sister uniform advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletlitecoin_addr_bip84(self):
         self.address_tester(btcrseed.WalletLitecoin, "ltc1q2dzc0u75p5aule30w5t5hjdzhgh2kmgqyh2t0f", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate"
-                            " sister uniform advice pen praise soap lizard festival connect baby")
+                            ELEMENT_MNEMONIC)
 
     def test_walletbch_BCH_Unsplit(self):
         self.address_tester(btcrseed.WalletBCH, "1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop")
+                            CERTAIN_MNEMONIC)
 
     def test_walletbch(self):
         self.address_tester(btcrseed.WalletBCH, "bitcoincash:qz7753xzek843j50cgtc526wdmlpm5v5eyt92gznrt", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop")
+                            CERTAIN_MNEMONIC)
 
     # Test to ensure that bundled derivation path files work correctly
     def test_pathfile_BTC_Electrum_Legacy(self):
@@ -747,27 +875,27 @@ class TestRecoveryFromAddress(unittest.TestCase):
 
     def test_pathfile_BTC_BRD(self):
         self.address_tester(btcrseed.WalletBIP39, "1FpWokPArYJKkWWiTqsnoVaFJL4PM3Nqdf", 2,
-                            "talk swamp tool right wide vital midnight cushion fiber blouse field transfer",
+                            TALK_MNEMONIC,
                             pathlist_file="BTC.txt")
 
     def test_pathfile_BTC_BIP44(self):
         self.address_tester(btcrseed.WalletBIP39, "1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                            CERTAIN_MNEMONIC,
                             pathlist_file="BTC.txt")
 
     def test_pathfile_BTC_BIP49(self):
         self.address_tester(btcrseed.WalletBIP39, "3NiRFNztVLMZF21gx6eE1nL3Q57GMGuunG", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="BTC.txt")
 
     def test_pathfile_BTC_BIP84(self):
         self.address_tester(btcrseed.WalletBIP39, "bc1qv87qf7prhjf2ld8vgm7l0mj59jggm6ae5jdkx2", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="BTC.txt")
 
     def test_pathfile_LTC_BIP44(self):
         self.address_tester(btcrseed.WalletBIP39, "LhHbcBk84JpB41otvD7qqWzyGgyr8yDJ2a", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="LTC.txt")
 
     def test_pathfile_LTC_Atomic(self):
@@ -777,107 +905,107 @@ class TestRecoveryFromAddress(unittest.TestCase):
 
     def test_pathfile_LTC_BIP49(self):
         self.address_tester(btcrseed.WalletBIP39, "MQT8szKNYyJU1hUPLnsfCYXkqLQbTewsj9", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="LTC.txt")
 
     def test_pathfile_LTC_BIP84(self):
         self.address_tester(btcrseed.WalletBIP39, "ltc1q2dzc0u75p5aule30w5t5hjdzhgh2kmgqyh2t0f", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="LTC.txt")
 
-    @unittest.skipUnless(can_load_keccak(), "requires pycryptodome")
+    @skipUnlessKeccak
     def test_pathfile_Eth_Coinomi(self):
         self.address_tester(btcrseed.WalletEthereum, "0xE16fCCbBa5EC2C2e4584A846ce3b77a6F37E863c", 2,
-                            "talk swamp tool right wide vital midnight cushion fiber blouse field transfer",
+                            TALK_MNEMONIC,
                             pathlist_file="ETH.txt")
 
-    @unittest.skipUnless(can_load_keccak(), "requires pycryptodome")
+    @skipUnlessKeccak
     def test_pathfile_Eth_Default(self):
         self.address_tester(btcrseed.WalletEthereum, "0x1a05a75E4041eFB46A34F208b677F82C079197D8", 2,
-                            "talk swamp tool right wide vital midnight cushion fiber blouse field transfer",
+                            TALK_MNEMONIC,
                             pathlist_file="ETH.txt")
 
     def test_pathfile_BCH_Unsplit(self):
         self.address_tester(btcrseed.WalletBIP39, "1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                            CERTAIN_MNEMONIC,
                             pathlist_file="BCH.txt")
 
     def test_pathfile_BCH(self):
         self.address_tester(btcrseed.WalletBIP39, "bitcoincash:qz7753xzek843j50cgtc526wdmlpm5v5eyt92gznrt", 2,
-                            "certain come keen collect slab gauge photo inside mechanic deny leader drop",
+                            CERTAIN_MNEMONIC,
                             pathlist_file="BCH.txt")
 
     def test_pathfile_bip44_addr_VTC(self):
         self.address_tester(btcrseed.WalletBIP39, "VwrYFHeKbneYZdkPWTpXsUs3ZQ4ERan9tG", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="VTC.txt")
 
     def test_pathfile_bip49_addr_VTC(self):
         self.address_tester(btcrseed.WalletBIP39, "33DUUsVoodofnbrxFhqCSBkKaqjCHzQyYU", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="VTC.txt")
 
     def test_pathfile_bip84_addr_VTC(self):
         self.address_tester(btcrseed.WalletBIP39, "vtc1q4r6d6w0xnd4t2rlj8njcl7m7a9k0ezk9rjnc77", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="VTC.txt")
 
     def test_pathfile_bip44_addr_MONA(self):
         self.address_tester(btcrseed.WalletBIP39, "M9BBjQC5vWktdbrfZZorybzUY75wtNB7JC", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="MONA.txt")
 
     def test_pathfile_bip49_addr_MONA(self):
         self.address_tester(btcrseed.WalletBIP39, "P8gv2vrMyVhDdjHgJf6yxH3vGarM9fCZ9f", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="MONA.txt")
 
     def test_pathfile_bip84_addr_MONA(self):
         self.address_tester(btcrseed.WalletBIP39, "monacoin1q9v93ngm8srxtq7lwzypehax7xvewh2vch68m2f", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="MONA.txt")
 
-    def test_bip44_addr_DGB(self):
+    def test_pathfile_bip44_addr_DGB(self):
         self.address_tester(btcrseed.WalletBIP39, "D8uui9mGXztcpZy5t5jWpSimCCyEDjYRHY", 5,
-                            "barrel tag debate reopen federal fee soda fog twelve garage sweet current",
+                            BARREL_MNEMONIC,
                             pathlist_file="DGB.txt")
 
     def test_pathfile_bip49_addr_DGB(self):
         self.address_tester(btcrseed.WalletBIP39, "SjM4p9vWB7GvsiNMgyZef67SJz3SgmPwhj", 5,
-                            "barrel tag debate reopen federal fee soda fog twelve garage sweet current",
+                            BARREL_MNEMONIC,
                             pathlist_file="DGB.txt")
 
     def test_pathfile_bip84_addr_DGB(self):
         self.address_tester(btcrseed.WalletBIP39, "dgb1qmtpcmpt5amuvvwvpelh220ec2ck7q4prsy2tqy", 5,
-                            "barrel tag debate reopen federal fee soda fog twelve garage sweet current",
+                            BARREL_MNEMONIC,
                             pathlist_file="DGB.txt")
 
     def test_pathfile_bip44_addr_DASH(self):
         self.address_tester(btcrseed.WalletBIP39, "XkRVBsXz1UG7LP48QKT4ZEbyUS54oRjYpM", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="DASH.txt")
 
     def test_pathfile_bip44_addr_DOGE(self):
         self.address_tester(btcrseed.WalletBIP39, "DANb1e9B2WtHJNDJUsiu1fTrtAzGJhqkPa", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="DOGE.txt")
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
     def test_pathfile_bip44_addr_GRS(self):
         self.address_tester(btcrseed.WalletBIP39, "FqGMQvKCb2idGbDd6SUBFuugynXRACEzuQ", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="GRS.txt")
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
     def test_pathfile_bip49_addr_GRS(self):
         self.address_tester(btcrseed.WalletBIP39, "384swZndJ7CjZhqx7JL29Whnommy9s9phF", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="GRS.txt")
 
     @skipUnless(can_load_groestlcoin_hash, "requires groestlcoin_hash")
     def test_pathfile_bip84_addr_GRS(self):
         self.address_tester(btcrseed.WalletBIP39, "grs1qy9qewq3x843gss8z6h22gmc03gfzuuj7hz505a", 2,
-                            "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                            ELEMENT_MNEMONIC,
                             pathlist_file="GRS.txt")
 
     def test_bip44_addr_en(self):
@@ -888,11 +1016,11 @@ class TestRecoveryFromAddress(unittest.TestCase):
         self.address_tester(btcrseed.WalletBIP39, "14phjB1jQKNvXnuq16f7rMe2uz87j8mxoq", 2,
                             "juic exch sess acco prot pott imme sati wood arm old hell", )
 
-    def test_bip44_addr_en(self):
+    def test_bip44_addr_es(self):
         self.address_tester(btcrseed.WalletBIP39, "1N1nFiNA7fXAoRNXfLZTQDtbNCoZKMV3hF", 2,
                             "kilo equipo reducir academia pasta pájaro imitar queja voraz ámbito nevar hebra", )
 
-    def test_bip44_addr_en_firstfour(self):
+    def test_bip44_addr_es_firstfour(self):
         self.address_tester(btcrseed.WalletBIP39, "1N1nFiNA7fXAoRNXfLZTQDtbNCoZKMV3hF", 2,
                             "kilo equi redu acad past pája imit quej vora ámbi neva hebr", )
 
@@ -924,15 +1052,11 @@ class TestRecoveryFromAddress(unittest.TestCase):
         self.address_tester(btcrseed.WalletBIP39, "18yGPGc5TvjmancDMTnPNCFyjMJRrUXZnZ", 2,
                             "くやくしょ　いふく　つよい　はいち　わかめ　ぎじたいけん　しのぐ　くさき　いきもの　ふりる　みがく　でんりょく", )
 
-    def test_bip44_addr_ja(self):
-        self.address_tester(btcrseed.WalletBIP39, "18yGPGc5TvjmancDMTnPNCFyjMJRrUXZnZ", 2,
-                            "くやくしょ　いふく　つよい　はいち　わかめ　ぎじたいけん　しのぐ　くさき　いきもの　ふりる　みがく　でんりょく", )
-
     def test_bip44_addr_zh_hans(self):
         self.address_tester(btcrseed.WalletBIP39, "1H47vZSaZ25LqcJSmK6eZokgWL4cXfJ248", 2,
                             "端 悉 瘦 任 鸿 纠 诸 罩 斤 与 语 柔", )
 
-    def test_bip44_addr_zh_hans(self):
+    def test_bip44_addr_zh_hant(self):
         self.address_tester(btcrseed.WalletBIP39, "1Hc8Pf86Zy52qY1Pp2fdSvvewfXcp1k6CM", 2,
                             "退 命 倆 冠 扇 往 雛 句 振 鉤 登 葡", )
 
@@ -948,149 +1072,123 @@ class TestRecoveryFromAddress(unittest.TestCase):
         self.address_tester(btcrseed.WalletBIP39, "1QmUCi3yv1A8ZWd3Xd14D5dVKdCEQruKi", 2,
                             "fanf tubu boxe almo quar beld camp gaso aren pasm rose crua", )
 
-    @skipUnless(has_any_opencl_devices, "requires OpenCL and a compatible device")
-    def test_BIP39_BTC_OpenCL_Brute(self):
-        the_address = "1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3"
-        the_address_limit = 2
-        correct_mnemonic = "certain come keen collect slab gauge photo inside mechanic deny leader drop"
-        wallet = btcrseed.WalletBIP39.create_from_params(addresses=[the_address], address_limit=the_address_limit)
-
-        # Convert the mnemonic string into a mnemonic_ids_guess
-        wallet.config_mnemonic(correct_mnemonic)
-        correct_mnemonic_ids = btcrseed.mnemonic_ids_guess
-
-        # Creates wrong mnemonic id guesses
-        wrong_mnemonic_iter = wallet.performance_iterator()
-
-        btcrecover.opencl_helpers.auto_select_opencl_platform(wallet)
-
-        btcrecover.opencl_helpers.init_opencl_contexts(wallet)
-
-        self.assertEqual(btcrseed.WalletBIP39._return_verified_password_or_false_opencl(wallet,
-                                                                                        (wrong_mnemonic_iter.__next__(),
-                                                                                         wrong_mnemonic_iter.__next__())),
-                         (False, 2))
-        self.assertEqual(btcrseed.WalletBIP39._return_verified_password_or_false_opencl(wallet,
-                                                                                        (wrong_mnemonic_iter.__next__(),
-                                                                                         correct_mnemonic_ids,
-                                                                                         wrong_mnemonic_iter.__next__())),
-                         (correct_mnemonic_ids, 2))
-
-        # Make sure the address_limit is respected (note the "the_address_limit-1" below)
-        wallet = btcrseed.WalletBIP39.create_from_params(addresses=[the_address], address_limit=the_address_limit - 1)
-        wallet.config_mnemonic(correct_mnemonic)
 
-        btcrecover.opencl_helpers.auto_select_opencl_platform(wallet)
-
-        btcrecover.opencl_helpers.init_opencl_contexts(wallet)
-
-        self.assertEqual(btcrseed.WalletBIP39._return_verified_password_or_false_opencl(wallet,
-                                                                                        (correct_mnemonic_ids,)),
-                         (False, 1))
+class TestRecoveryFromAddressOpenCL(unittest.TestCase):
+    # The wallet type, address, address limit, mnemonic and config_mnemonic() arguments for each test
+    OPENCL_TEST_WALLETS = {
+        "BIP39_BTC": (btcrseed.WalletBIP39,     "1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3",         2, CERTAIN_MNEMONIC, {}),
+        "BIP39_Eth": (btcrseed.WalletEthereum,  "0x38b132519c151f602964Bf6bF348aF6C92d35d28", 2, CERTAIN_MNEMONIC, {}),
+        "Electrum":  (btcrseed.WalletElectrum2, "bc1qztc99re7ml7hv4q4ds3jv29w7u4evwqd6t76kz", 5,
+                      "first focus motor give search custom grocery suspect myth popular trigger praise",
+                      dict(expected_len=12)),
+    }
+
+    # Initializing the OpenCL contexts compiles their kernels for the device, so each wallet is
+    # created and initialized just once here (the contexts don't depend on the address limit).
+    # The seed wallets' PBKDF2 contexts only depend on their salts' lengths (the salts themselves
+    # are passed in with each batch), so wallets with the same salt lengths share their contexts.
+    @classmethod
+    def setUpClass(cls):
+        if not has_any_opencl_devices():
+            raise unittest.SkipTest("requires OpenCL and a compatible device")
+
+        # The platform (and its work group size) is chosen once for all the wallets; if the
+        # BTCR_TEST_OPENCL_PLATFORM environment variable is set, that platform number is used
+        # instead, skipping the auto-selection scan over every platform and device
+        opencl_platform = os.environ.get("BTCR_TEST_OPENCL_PLATFORM") or None
+        if opencl_platform:
+            import pyopencl
+            opencl_platform = int(opencl_platform)
+            opencl_device_worksize = max(device.max_work_group_size
+                                         for device in pyopencl.get_platforms()[opencl_platform].get_devices())
+
+        cls.opencl_wallets = {}
+        opencl_contexts    = {}  # salt lengths -> a wallet whose OpenCL contexts were initialized for them
+        for name, (wallet_type, the_address, the_address_limit, correct_mnemonic, kwds) in cls.OPENCL_TEST_WALLETS.items():
+            wallet = wallet_type.create_from_params(addresses=[the_address], address_limit=the_address_limit)
+            config_mnemonic_cached(wallet, correct_mnemonic, **kwds)
+            if opencl_platform is None:
+                btcrecover.opencl_helpers.auto_select_opencl_platform(wallet)
+                opencl_platform, opencl_device_worksize = wallet.opencl_platform, wallet.opencl_device_worksize
+            else:
+                wallet.opencl_platform, wallet.opencl_device_worksize = opencl_platform, opencl_device_worksize
+            salt_lens = tuple(map(len, wallet._derivation_salts))
+            if salt_lens in opencl_contexts:
+                initialized_wallet = opencl_contexts[salt_lens]
+                for attr in "opencl_algo", "opencl_algo_2", "opencl_algo_3", "opencl_context_pbkdf2_sha512":
+                    setattr(wallet, attr, getattr(initialized_wallet, attr))
+            else:
+                btcrecover.opencl_helpers.init_opencl_contexts(wallet)
+                opencl_contexts[salt_lens] = wallet
+            cls.opencl_wallets[name] = wallet
 
-        del wallet
+    @classmethod
+    def tearDownClass(cls):
+        del cls.opencl_wallets
 
-    @skipUnless(has_any_opencl_devices, "requires OpenCL and a compatible device")
-    def test_BIP39_Eth_OpenCL_Brute(self):
-        the_address = "0x38b132519c151f602964Bf6bF348aF6C92d35d28"
-        the_address_limit = 2
-        correct_mnemonic = "certain come keen collect slab gauge photo inside mechanic deny leader drop"
-        wallet = btcrseed.WalletEthereum.create_from_params(addresses=[the_address], address_limit=the_address_limit)
+    def opencl_tester(self, name):
+        wallet_type, the_address, the_address_limit, correct_mnemonic, kwds = self.OPENCL_TEST_WALLETS[name]
+        wallet = self.opencl_wallets[name]
+        wallet.address_limit = the_address_limit
 
         # Convert the mnemonic string into a mnemonic_ids_guess
-        wallet.config_mnemonic(correct_mnemonic)
+        config_mnemonic_cached(wallet, correct_mnemonic, **kwds)
         correct_mnemonic_ids = btcrseed.mnemonic_ids_guess
 
         # Creates wrong mnemonic id guesses
-        wrong_mnemonic_iter = wallet.performance_iterator()
+        wrong_mnemonic_ids = next_batch(wallet.performance_iterator(), 4)
 
-        btcrecover.opencl_helpers.auto_select_opencl_platform(wallet)
-
-        btcrecover.opencl_helpers.init_opencl_contexts(wallet)
-
-        self.assertEqual(btcrseed.WalletEthereum._return_verified_password_or_false_opencl(wallet,
-                                                                                           (
-                                                                                           wrong_mnemonic_iter.__next__(),
-                                                                                           wrong_mnemonic_iter.__next__())),
-                         (False, 2))
-        self.assertEqual(btcrseed.WalletEthereum._return_verified_password_or_false_opencl(wallet,
-                                                                                           (
-                                                                                           wrong_mnemonic_iter.__next__(),
-                                                                                           correct_mnemonic_ids,
-                                                                                           wrong_mnemonic_iter.__next__())),
-                         (correct_mnemonic_ids, 2))
+        # Each call is a separate batch for the device: one with no correct guess, then one with
+        # the wrong guesses and the correct one all sent together
+        with strict_warnings():
+            self.assertEqual(wallet._return_verified_password_or_false_opencl(
+                wrong_mnemonic_ids[:2]), (False, 2))
+            self.assertEqual(wallet._return_verified_password_or_false_opencl(
+                wrong_mnemonic_ids[:3] + (correct_mnemonic_ids, wrong_mnemonic_ids[3])),
+                (correct_mnemonic_ids, 4))
 
         # Make sure the address_limit is respected (note the "the_address_limit-1" below)
-        wallet = btcrseed.WalletEthereum.create_from_params(addresses=[the_address],
-                                                            address_limit=the_address_limit - 1)
-        wallet.config_mnemonic(correct_mnemonic)
-
-        btcrecover.opencl_helpers.auto_select_opencl_platform(wallet)
+        wallet.address_limit = the_address_limit - 1
+        with strict_warnings():
+            self.assertEqual(wallet._return_verified_password_or_false_opencl(
+                (correct_mnemonic_ids,)), (False, 1))
 
-        btcrecover.opencl_helpers.init_opencl_contexts(wallet)
-
-        self.assertEqual(btcrseed.WalletEthereum._return_verified_password_or_false_opencl(wallet,
-                                                                                           (correct_mnemonic_ids,)),
-                         (False, 1))
+    def test_BIP39_BTC_OpenCL_Brute(self):
+        self.opencl_tester("BIP39_BTC")
 
-        del wallet
+    def test_BIP39_Eth_OpenCL_Brute(self):
+        self.opencl_tester("BIP39_Eth")
 
-    @skipUnless(has_any_opencl_devices, "requires OpenCL and a compatible device")
     def test_Electrum_OpenCL_Brute(self):
-        the_address = "bc1qztc99re7ml7hv4q4ds3jv29w7u4evwqd6t76kz"
-        the_address_limit = 5
-        correct_mnemonic = "first focus motor give search custom grocery suspect myth popular trigger praise"
-        wallet = btcrseed.WalletElectrum2.create_from_params(addresses=[the_address], address_limit=the_address_limit)
-
-        # Convert the mnemonic string into a mnemonic_ids_guess
-        wallet.config_mnemonic(correct_mnemonic, expected_len=12)
-        correct_mnemonic_ids = btcrseed.mnemonic_ids_guess
-
-        # Creates wrong mnemonic id guesses
-        wrong_mnemonic_iter = wallet.performance_iterator()
-
-        btcrecover.opencl_helpers.auto_select_opencl_platform(wallet)
-
-        btcrecover.opencl_helpers.init_opencl_contexts(wallet)
-
-        self.assertEqual(btcrseed.WalletElectrum2._return_verified_password_or_false_opencl(wallet,
-                                                                                            (
-                                                                                            wrong_mnemonic_iter.__next__(),
-                                                                                            wrong_mnemonic_iter.__next__())),
-                         (False, 2))
-        self.assertEqual(btcrseed.WalletElectrum2._return_verified_password_or_false_opencl(wallet,
-                                                                                            (
-                                                                                            wrong_mnemonic_iter.__next__(),
-                                                                                            correct_mnemonic_ids,
-                                                                                            wrong_mnemonic_iter.__next__())),
-                         (correct_mnemonic_ids, 2))
-
-        # Make sure the address_limit is respected (note the "the_address_limit-1" below)
-        wallet = btcrseed.WalletElectrum2.create_from_params(addresses=[the_address],
-                                                             address_limit=the_address_limit - 1)
-        wallet.config_mnemonic(correct_mnemonic, expected_len=12)
+        self.opencl_tester("Electrum")
 
-        btcrecover.opencl_helpers.auto_select_opencl_platform(wallet)
 
-        btcrecover.opencl_helpers.init_opencl_contexts(wallet)
+# Doesn't need OpenCL: pyopencl's platform and device enumeration is replaced by a fake CPU and GPU
+class TestAutoSelectOpenCLPlatform(unittest.TestCase):
 
-        self.assertEqual(btcrseed.WalletElectrum2._return_verified_password_or_false_opencl(wallet,
-                                                                                            (correct_mnemonic_ids,)),
-                         (False, 1))
+    def test_platform_cached(self):
+        cpu_platform = types.SimpleNamespace(get_devices=lambda: [types.SimpleNamespace(
+            type=2, vendor="Intel", name="CPU", max_work_group_size=256)])
+        gpu_platform = types.SimpleNamespace(get_devices=lambda: [types.SimpleNamespace(
+            type=4, vendor="NVIDIA Corporation", name="GPU", max_work_group_size=1024)])
+        fake_pyopencl = types.SimpleNamespace(get_platforms=unittest.mock.Mock(return_value=[cpu_platform, gpu_platform]),
+                                              device_type=types.SimpleNamespace(CPU=2, GPU=4, ACCELERATOR=8))
 
-        del wallet
+        opencl_helpers = btcrecover.opencl_helpers
+        with unittest.mock.patch.object(opencl_helpers, "pyopencl", fake_pyopencl, create=True), \
+             unittest.mock.patch.object(opencl_helpers, "_auto_selected_platform", None), \
+             contextlib.redirect_stdout(io.StringIO()):
+            for wallet_num in range(2):
+                wallet = types.SimpleNamespace()
+                opencl_helpers.auto_select_opencl_platform(wallet)
+                self.assertEqual((wallet.opencl_platform, wallet.opencl_device_worksize), (1, 1024))
+            fake_pyopencl.get_platforms.assert_called_once_with()
 
 
 class OpenCL_Tests(unittest.TestSuite):
     def __init__(self):
         super(OpenCL_Tests, self).__init__()
-        self.addTest(unittest.defaultTestLoader.loadTestsFromNames(("TestRecoveryFromAddress." + method_name
-                                                                    for method_name in (
-                                                                        "test_BIP39_BTC_OpenCL_Brute",
-                                                                        "test_BIP39_Eth_OpenCL_Brute",
-                                                                        "test_Electrum_OpenCL_Brute")),
-                                                                   module=sys.modules[__name__]
-                                                                   ))
+        self.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestRecoveryFromAddressOpenCL))
 
 
 class TestAddressSet(unittest.TestCase):
@@ -1100,12 +1198,20 @@ class TestAddressSet(unittest.TestCase):
 
     def test_add(self):
         aset = AddressSet(self.TABLE_LEN)
-        addr = "".join(chr(b) for b in range(20))
+        addr = bytes(range(20))
         self.assertNotIn(addr, aset)
         aset.add(addr)
         self.assertIn(addr, aset)
         self.assertEqual(len(aset), 1)
 
+    def test_add_str(self):
+        aset = AddressSet(self.TABLE_LEN)
+        addr = bytes(range(236, 256))  # (none of which are ASCII)
+        aset.add(addr.decode("latin-1"))
+        self.assertIn(addr, aset)
+        self.assertIn(addr.decode("latin-1"), aset)
+        self.assertEqual(len(aset), 1)
+
     def collision_tester(self, aset, addr1, addr2):
         aset.add(addr1)
         self.assertIn(addr1, aset)
@@ -1121,23 +1227,23 @@ class TestAddressSet(unittest.TestCase):
     def test_collision(self):
         aset = AddressSet(self.TABLE_LEN)
         # the last HASH_BYTES (1) bytes are the "hash", and only the next BYTES_PER_ADDR (8) rightmost bytes are stored
-        addr1 = "".join(chr(b) for b in range(20))
-        addr2 = addr1.replace(chr(20 - self.HASH_BYTES - self.BYTES_PER_ADDR), "\0")  # the leftmost byte that's stored
+        addr1 = bytes(range(20))
+        addr2 = addr1.replace(bytes((20 - self.HASH_BYTES - self.BYTES_PER_ADDR,)), b"\0")  # the leftmost byte that's stored
         self.collision_tester(aset, addr1, addr2)
 
     #
     def test_collision_fail(self):
         aset = AddressSet(self.TABLE_LEN)
         # the last 1 (HASH_BYTES) bytes are the "hash", and only the next 8 (BYTES_PER_ADDR) rightmost bytes are stored
-        addr1 = "".join(chr(b) for b in range(20))
-        addr2 = addr1.replace(chr(20 - self.HASH_BYTES - self.BYTES_PER_ADDR - 1),
-                              "\0")  # the rightmost byte not stored
+        addr1 = bytes(range(20))
+        addr2 = addr1.replace(bytes((20 - self.HASH_BYTES - self.BYTES_PER_ADDR - 1,)),
+                              b"\0")  # the rightmost byte not stored
         self.assertRaises(unittest.TestCase.failureException, self.collision_tester, aset, addr1, addr2)
         self.assertEqual(len(aset), 1)
 
     def test_null(self):
         aset = AddressSet(self.TABLE_LEN)
-        addr = 20 * "\0"
+        addr = 20 * b"\0"
         aset.add(addr)
         self.assertNotIn(addr, aset)
         self.assertEqual(len(aset), 0)
@@ -1145,21 +1251,26 @@ class TestAddressSet(unittest.TestCase):
     # very unlikely to fail, though it isn't deterministic, so may fail somtimes.
     # If it fails repeatedly, there's probably a significant problem
     def test_false_positives(self):
-        aset = AddressSet(1024, bytes_per_addr=8)
+        self.false_positives_tester(bytes_per_addr=8)
+
+    # with half the bytes stored per address, false positives are more likely, but still very unlikely
+    def test_false_positives_4_bytes(self):
+        self.false_positives_tester(bytes_per_addr=4)
+
+    def false_positives_tester(self, bytes_per_addr):
+        aset = AddressSet(1024, bytes_per_addr=bytes_per_addr)
         rand_byte_count = aset._hash_bytes + aset._bytes_per_addr
-        nonrand_prefix = (20 - rand_byte_count) * "\0"
+        nonrand_prefix = (20 - rand_byte_count) * b"\0"
         for i in range(aset._max_len):
-            aset.add(nonrand_prefix + "".join(chr(random.randrange(256)) for i in range(rand_byte_count)))
+            aset.add(nonrand_prefix + os.urandom(rand_byte_count))
         for i in range(8192):
-            self.assertNotIn(
-                nonrand_prefix + "".join(chr(random.randrange(256)) for i in range(rand_byte_count)),
-                aset)
+            self.assertNotIn(nonrand_prefix + os.urandom(rand_byte_count), aset)
 
     def test_file(self):
         aset = AddressSet(self.TABLE_LEN)
-        addr = "".join(chr(b) for b in range(20))
+        addr = bytes(range(20))
         aset.add(addr)
-        dbfile = tempfile.TemporaryFile()
+        dbfile = tempfile.TemporaryFile(dir=temp_dir_root)
         aset.tofile(dbfile)
         dbfile.seek(0)
         aset = AddressSet.fromfile(dbfile)
@@ -1169,12 +1280,12 @@ class TestAddressSet(unittest.TestCase):
 
     def test_file_update(self):
         aset = AddressSet(self.TABLE_LEN)
-        dbfile = tempfile.NamedTemporaryFile(delete=False)
+        dbfile = tempfile.NamedTemporaryFile(delete=False, dir=temp_dir_root)
         try:
             aset.tofile(dbfile)
             dbfile.seek(0)
             aset = AddressSet.fromfile(dbfile, mmap_access=mmap.ACCESS_WRITE)
-            addr = "".join(chr(b) for b in range(20))
+            addr = bytes(range(20))
             aset.add(addr)
             aset.close()
             self.assertTrue(dbfile.closed)
@@ -1189,9 +1300,9 @@ class TestAddressSet(unittest.TestCase):
 
     def test_pickle_mmap(self):
         aset = AddressSet(self.TABLE_LEN)
-        addr = "".join(chr(b) for b in range(20))
+        addr = bytes(range(20))
         aset.add(addr)
-        dbfile = tempfile.NamedTemporaryFile(delete=False)
+        dbfile = tempfile.NamedTemporaryFile(delete=False, dir=temp_dir_root)
         try:
             aset.tofile(dbfile)
             dbfile.seek(0)
@@ -1206,9 +1317,51 @@ class TestAddressSet(unittest.TestCase):
             dbfile.close()
             os.remove(dbfile.name)
 
+    def test_create_address_db_bytes_per_addr(self):
+        temp_dir = tempfile.mkdtemp("-test-btcr", dir=temp_dir_root)
+        try:
+            addresslistfile = os.path.join(temp_dir, "addresses.txt")
+            with open(addresslistfile, "w") as listfile:
+                listfile.write("1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3\n")
+            dbfilename = os.path.join(temp_dir, "addresses.db")
+            with contextlib.redirect_stdout(io.StringIO()):
+                create_address_db(dbfilename, None, 8, addresslistfile=addresslistfile, bytes_per_addr=4)
+            with open(dbfilename, "rb") as dbfile:
+                aset = AddressSet.fromfile(dbfile)
+                self.assertEqual(aset._bytes_per_addr, 4)
+                self.assertIn(btcrseed.WalletBase._addresses_to_hash160s(["1AiAYaVJ7SCkDeNqgFz7UDecycgzb6LoT3"]).pop(), aset)
+                self.assertEqual(len(aset), 1)
+                aset.close()
+
+            # An update keeps the existing width, which can't be changed
+            with self.assertRaises(ValueError), contextlib.redirect_stdout(io.StringIO()):
+                create_address_db(dbfilename, None, 8, update=True, addresslistfile=addresslistfile, bytes_per_addr=8)
+        finally:
+            shutil.rmtree(temp_dir)
+
 
 class TestRecoveryFromAddressDB(unittest.TestCase):
 
+    # The test AddressDBs are only ever read, so each is loaded (memory-mapped) just once
+    # and shared by every test which uses it, and then closed after the last of them
+    @classmethod
+    def setUpClass(cls):
+        cls.addressdbs = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        for addressdb in cls.addressdbs.values():
+            addressdb.close()
+        del cls.addressdbs
+
+    def load_addressdb(self, test_address_db):
+        addressdb = self.addressdbs.get(test_address_db)
+        if addressdb is None:
+            addressdb = AddressSet.fromfile(open("./btcrecover/test/test-addressdbs/" + test_address_db, "rb"),
+                                            preload=False)
+            self.addressdbs[test_address_db] = addressdb
+        return addressdb
+
     def addressdb_tester(self, wallet_type, the_address_limit, correct_mnemonic, test_path, test_address_db, **kwds):
         assert the_address_limit > 1
 
@@ -1217,136 +1370,136 @@ class TestRecoveryFromAddressDB(unittest.TestCase):
             raise unittest.SkipTest("requires ./btcrecover/test/test-addressdbs/" + test_address_db)
 
         # Test Basic BIP44 AddressDB Search
-        addressdb = AddressSet.fromfile(open("./btcrecover/test/test-addressdbs/" + test_address_db, "rb"),
-                                        preload=False)
+        addressdb = self.load_addressdb(test_address_db)
         wallet = wallet_type.create_from_params(hash160s=addressdb, address_limit=the_address_limit, path=[test_path])
 
         # Convert the mnemonic string into a mnemonic_ids_guess
-        wallet.config_mnemonic(correct_mnemonic, **kwds)
+        config_mnemonic_cached(wallet, correct_mnemonic, **kwds)
         correct_mnemonic_ids = btcrseed.mnemonic_ids_guess
 
         # Creates wrong mnemonic id guesses
-        wrong_mnemonic_iter = wallet.performance_iterator()
+        wrong_mnemonic_ids = next_batch(wallet.performance_iterator(), 4)
 
-        self.assertEqual(wallet.return_verified_password_or_false(
-            (wrong_mnemonic_iter.__next__(), wrong_mnemonic_iter.__next__())), (False, 2))
-        self.assertEqual(wallet.return_verified_password_or_false(
-            (wrong_mnemonic_iter.__next__(), correct_mnemonic_ids, wrong_mnemonic_iter.__next__())),
-            (correct_mnemonic_ids, 2))
+        with strict_warnings():
+            self.assertEqual(wallet.return_verified_password_or_false(
+                wrong_mnemonic_ids[:2]), (False, 2))
+            self.assertEqual(wallet.return_verified_password_or_false(
+                (wrong_mnemonic_ids[2], correct_mnemonic_ids, wrong_mnemonic_ids[3])),
+                (correct_mnemonic_ids, 2))
 
         # Make sure the address_limit is respected (note the "the_address_limit-1" below)
-        wallet = wallet_type.create_from_params(hash160s=addressdb, address_limit=the_address_limit - 1, path=[test_path])
-        wallet.config_mnemonic(correct_mnemonic, **kwds)
-        self.assertEqual(wallet.return_verified_password_or_false(
-            (correct_mnemonic_ids,)), (False, 1))
+        wallet.address_limit = the_address_limit - 1
+        with strict_warnings():
+            self.assertEqual(wallet.return_verified_password_or_false(
+                (correct_mnemonic_ids,)), (False, 1))
 
     # BCH AddressDB Tests
     # m/44'/145'/0'/0/1	bitcoincash:qrdupm96x04u3ssjnuj7lpy7adt9y34p5vzh95y0y7
     def test_addressdb_bip44_bch(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/44'/145'/0'/0", "addresses-BCH-Test.db")
 
     # BCH AddressDB + BIP39 Passphrase Test
     # m/44'/145'/0'/0/1	bitcoincash:qprwa49yg44mj7geswgdmlylkp9pff32c5kr8a2wq3
     def test_addressdb_bip44_bch_passphrase(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/44'/145'/0'/0", "addresses-BCH-Test.db", passphrases=[u"youtube",])
 
     # BTC AddressDB Tests
     # m/44'/0'/1'/0/1	1Bi3vKepTDmrRYC59WjaGDVDrg8qPsrc31
     def test_addressdb_bip44_btc(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/44'/0'/1'/0", "addresses-BTC-Test.db")
 
     # m/49'/0'/1'/0/1	3GHFddEy3hPdwqh6gsTRfAZX83FfHKDNqF
     def test_addressdb_bip49_btc(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/49'/0'/1'/0", "addresses-BTC-Test.db")
 
     # m/84'/0'/1'/0/1	bc1ql4vgz4f8qef29x224935yxtun44prgr3eh06jh
     def test_addressdb_bip84_btc(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/84'/0'/1'/0", "addresses-BTC-Test.db")
 
     # LTC AddressDB Tests
     # m/44'/2'/1'/0/1	LgXiUTLMKcoaqvUPMNJo1RmpAGFMHD75tr
     def test_addressdb_bip44_ltc(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/44'/2'/1'/0", "addresses-LTC-Test.db")
 
     # m/49'/2'/1'/0/1	MQ9ucyhhaEncRmdL3uq9XhzDre37mvFTCf
     def test_addressdb_bip49_ltc(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/49'/2'/1'/0", "addresses-LTC-Test.db")
 
     # m/84'/2'/1'/0/1	ltc1qgpn2phk8c7k966xjufrrll59qa8wnvnx68jtt6
     def test_addressdb_bip84_ltc(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/84'/2'/1'/0", "addresses-LTC-Test.db")
 
     # VTC AddressDB Tests
     # m/44'/28'/1'/0/1	VuMksxrDy48HZr15WR3Lwn6yvLKhuHgEUc
     def test_addressdb_bip44_vtc(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/44'/28'/1'/0", "addresses-VTC-Test.db")
 
     # m/49'/28'/1'/0/1	3LSAzLG2WuzHABHoi3FiGvv4BqvvwnADCq
     def test_addressdb_bip49_vtc(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/49'/28'/1'/0", "addresses-VTC-Test.db")
 
     # m/84'/28'/1'/0/1	vtc1qpuw3nh0xfa4tcvxp3q8dc2cqhqtgsf4xg6r273
     def test_addressdb_bip84_vtc(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/84'/28'/1'/0", "addresses-VTC-Test.db")
 
     # MONA AddressDB Tests
     # m/44'/22'/1'/0/1	MPEbQUqKXPf8A9TCQTiGPhMcRBPwySroHg
     def test_addressdb_bip44_mona(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/44'/22'/1'/0", "addresses-MONA-Test.db")
 
     # m/49'/22'/1'/0/1	PNJmRN936aqgzuyXaRKiEHsy5mHKw4QWqn
     def test_addressdb_bip49_mona(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/49'/22'/1'/0", "addresses-MONA-Test.db")
 
     # m/84'/22'/1'/0/1	mona1qx9kllhxc4u4evjdhyejsseyqntjursxtewdcmm
     def test_addressdb_bip84_mona(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 2,
-                              "element entire sniff tired miracle solve shadow scatter hello never tank side sight isolate sister uniform advice pen praise soap lizard festival connect baby",
+                              ELEMENT_MNEMONIC,
                               "m/84'/22'/1'/0", "addresses-MONA-Test.db")
 
     # DGB AddressDB Tests
     # m/44'/20'/0'/4	D8uui9mGXztcpZy5t5jWpSimCCyEDjYRHY
     def test_addressdb_bip44_dgb(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 5,
-                              "barrel tag debate reopen federal fee soda fog twelve garage sweet current",
+                              BARREL_MNEMONIC,
                               "m/44'/20'/0'/0", "addresses-DGB-Test.db")
 
     # m/49'/20'/0'/4	SjM4p9vWB7GvsiNMgyZef67SJz3SgmPwhj
     def test_addressdb_bip49_dgb(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 5,
-                              "barrel tag debate reopen federal fee soda fog twelve garage sweet current",
+                              BARREL_MNEMONIC,
                               "m/49'/20'/0'/0", "addresses-DGB-Test.db")
 
     # m/84'/20'/0'/4	dgb1qmtpcmpt5amuvvwvpelh220ec2ck7q4prsy2tqy
     def test_addressdb_bip84_dgb(self):
         self.addressdb_tester(btcrseed.WalletBIP39, 5,
-                              "barrel tag debate reopen federal fee soda fog twelve garage sweet current",
+                              BARREL_MNEMONIC,
                               "m/84'/20'/0'/0", "addresses-DGB-Test.db")
 
 
@@ -1375,19 +1528,19 @@ class TestSeedTypos(unittest.TestCase):
 
     def test_replacewrong(self):
         self.seed_tester(self.XPUB,
-                         "certain come keen collect slab gauge photo inside mechanic deny leader drop",  # correct
+                         CERTAIN_MNEMONIC,  # correct
                          "certain X    keen collect slab gauge photo inside mechanic deny leader drop",  # guess
                          big_typos=1)
 
     def test_insert(self):
         self.seed_tester(self.XPUB,
-                         "certain come keen collect slab gauge photo inside mechanic deny leader drop",  # correct
+                         CERTAIN_MNEMONIC,  # correct
                          "        come keen collect slab gauge photo inside mechanic deny leader drop",  # guess
                          big_typos=1)
 
     def test_swap(self):
         self.seed_tester(self.XPUB,
-                         "certain come keen collect slab gauge photo inside mechanic deny leader drop",  # correct
+                         CERTAIN_MNEMONIC,  # correct
                          "certain keen come collect slab gauge photo inside mechanic deny leader drop",  # guess
                          typos=1)
 
@@ -1405,7 +1558,7 @@ class TestSeedTypos(unittest.TestCase):
 
     def test_replaceclose_firstfour(self):
         self.seed_tester(self.XPUB,
-                         "certain come keen collect slab gauge photo inside mechanic deny leader drop",  # correct
+                         CERTAIN_MNEMONIC,  # correct
                          "cere    come keen coll    slab gaug  phot  insi   mech     deny lead   drop",  # guess
                          # "cere" is close to "cert" in the en-firstfour language, even though "cereal" is not close to "certain"
                          typos=1)
@@ -1413,19 +1566,10 @@ class TestSeedTypos(unittest.TestCase):
 
 class TestRecoverySeedListsGenerators(unittest.TestCase):
     # Both the tokenlist generator and seedlist generator should generate the same output, the list of passwords below.
+    # (the same nine words, followed by every ordering of the last three, in itertools.permutations() order)
     expected_passwordlist = [[
-        ['ocean', 'hidden', 'kidney', 'famous', 'rich', 'season', 'gloom', 'husband', 'spring', 'boy', 'attitude',
-         'convince'],
-        ['ocean', 'hidden', 'kidney', 'famous', 'rich', 'season', 'gloom', 'husband', 'spring', 'boy', 'convince',
-         'attitude'],
-        ['ocean', 'hidden', 'kidney', 'famous', 'rich', 'season', 'gloom', 'husband', 'spring', 'attitude', 'boy',
-         'convince'],
-        ['ocean', 'hidden', 'kidney', 'famous', 'rich', 'season', 'gloom', 'husband', 'spring', 'attitude', 'convince',
-         'boy'],
-        ['ocean', 'hidden', 'kidney', 'famous', 'rich', 'season', 'gloom', 'husband', 'spring', 'convince', 'boy',
-         'attitude'],
-        ['ocean', 'hidden', 'kidney', 'famous', 'rich', 'season', 'gloom', 'husband', 'spring', 'convince', 'attitude',
-         'boy']
+        ['ocean', 'hidden', 'kidney', 'famous', 'rich', 'season', 'gloom', 'husband', 'spring'] + list(last_three)
+        for last_three in itertools.permutations(['boy', 'attitude', 'convince'])
     ]]
 
     def seedlist_tester(self, seedlistfile, correct_seedlist=None):
@@ -1489,13 +1633,98 @@ class QuickTests(unittest.TestSuite):
             self.addTests(suite)
 
 
+# Runs a batch of tests from one class (by their ids relative to this module) inside a worker
+# process, and returns their outcome along with any captured output so the parent can report it
+def _run_tests_in_worker(test_names, buffer = True):
+    stream = io.StringIO()
+    tests  = unittest.defaultTestLoader.loadTestsFromNames(test_names, sys.modules[__name__])
+    result = unittest.TextTestRunner(stream, buffer=buffer, verbosity=0).run(tests)
+    # Class and module fixture outcomes have ids such as "setUpClass (<module>.<class>)", which are
+    # left as they are; only the module name is stripped from the test ids
+    module_prefix = __name__ + "."
+    failed  = [test.id()[len(module_prefix):] if test.id().startswith(module_prefix) else test.id()
+               for test, _ in result.failures + result.errors]
+    skipped = [test.id() for test, _ in result.skipped]
+    # Tests which were run and neither failed nor skipped (class-level outcomes aren't counted in testsRun)
+    passed  = result.testsRun - sum(isinstance(test, unittest.TestCase)
+                                    for test, _ in result.failures + result.errors + result.skipped)
+    return passed, failed, result.testsRun, skipped, stream.getvalue()
+
+
+# Every test case in this module is independent (wallet files are copied into per-test temporary
+# directories, and btcrseed's module-level state is per-process), so they can be spread across
+# several processes. They're handed out in batches of tests from a single class so that the
+# module and class fixtures (and the caches they set up) are shared by all the tests in a batch
+def run_tests_in_parallel(test_names, processes, buffer = True):
+    loader = unittest.defaultTestLoader
+    module = sys.modules[__name__]
+    suite  = loader.loadTestsFromNames(test_names, module) if test_names else loader.loadTestsFromModule(module)
+
+    def iter_test_ids(suite):
+        for test in suite:
+            if isinstance(test, unittest.TestSuite):
+                yield from iter_test_ids(test)
+            else:
+                yield test.id().split(".", 1)[1]  # strip the module name
+
+    # Split each class's tests into (at most) one batch per process, largest batches first
+    batches = []
+    for class_name, test_ids in itertools.groupby(iter_test_ids(suite), key=lambda test_id: test_id.rpartition(".")[0]):
+        test_ids   = list(test_ids)
+        batch_size = -(-len(test_ids) // processes)
+        batches.extend(test_ids[i : i + batch_size] for i in range(0, len(test_ids), batch_size))
+    batches.sort(key=len, reverse=True)
+
+    # A class whose setUpClass() skips (or fails) reports the same single skip (or error) from
+    # each of its batches, so these are counted by test id
+    tests_run, tests_skipped, failures = 0, set(), set()
+    pool = multiprocessing.Pool(processes)
+    try:
+        for passed, failed, run, skipped, output in pool.imap_unordered(
+                functools.partial(_run_tests_in_worker, buffer=buffer), batches):
+            new_skipped = set(skipped) - tests_skipped
+            tests_run  += run
+            tests_skipped.update(skipped)
+            if failed:
+                failures.update(failed)
+                print(output, file=sys.stderr)
+            print("." * passed + "F" * len(failed) + "s" * len(new_skipped), end="", file=sys.stderr, flush=True)
+    except BaseException:
+        pool.terminate()
+        raise
+    # The pool is closed and joined rather than left to its context manager, which would terminate
+    # the workers; btcrpass treats SIGTERM like Ctrl-C, so each worker would print a traceback
+    pool.close()
+    pool.join()
+
+    print("\n" + "-" * 70 + "\nRan", tests_run, "tests using", processes, "processes\n", file=sys.stderr)
+    if failures:
+        print("FAILED (failures={}) {}".format(len(failures), ", ".join(sorted(failures))), file=sys.stderr)
+    else:
+        print("OK" + (" (skipped={})".format(len(tests_skipped)) if tests_skipped else ""), file=sys.stderr)
+    return not failures
+
+
 if __name__ == '__main__':
     import argparse
 
-    # Add one new argument to those already provided by unittest.main()
+    # Add new arguments to those already provided by unittest.main()
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument("--no-buffer", action="store_true")
+    parser.add_argument("--processes", type=int, default=1, metavar="COUNT",
+                        help="run the tests in COUNT worker processes (0 for one per CPU)")
     args, unittest_args = parser.parse_known_args()
     sys.argv[1:] = unittest_args
 
+    if args.processes < 0:
+        parser.error("--processes must be 0 or more")
+    if args.processes != 1:
+        # Only test names can be passed along to the workers, not unittest.main()'s own options
+        unsupported_args = [a for a in unittest_args if a.startswith("-")]
+        if unsupported_args:
+            parser.error("unittest options can't be combined with --processes: " + " ".join(unsupported_args))
+        sys.exit(0 if run_tests_in_parallel(unittest_args,
+                                            args.processes or multiprocessing.cpu_count(),
+                                            buffer=not args.no_buffer) else 1)
+
     unittest.main(buffer=not args.no_buffer)
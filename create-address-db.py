@@ -47,6 +47,7 @@ if __name__ == "__main__":
     parser.add_argument("--dbyolo",     action="store_true", help="Disable checking whether input blockchain is compatible with this tool...")
     parser.add_argument("--addrs_to_text", action="store_true", help="Append all found addresses to address.txt in the working directory while creating addressDB (Useful for debugging, will slow down AddressDB creation and produce a really big file, about 4x the size of the required AddressDB, about 32GB as of Jan 2020)")
     parser.add_argument("--dblength", default=31, help="The Maximum Number of Addresses the AddressDB can old, as a power of 2. Default = 31 ==> 2^31 Addresses. (Enough for BTC Blockchain @ April 2021", type=int)
+    parser.add_argument("--bytes-per-addr", help="The number of bytes of each address to store in the AddressDB. Default = 8. (4 halves the AddressDB size, at the cost of more false positives; can't be changed with --update)", type=int)
     parser.add_argument("--first-block-file", default=0, help="Start creating the AddressDB from a specific block file (Useful to keep DB size down)", type=int)
     parser.add_argument("--blocks-startdate", default="2009-01-01", help="Ignore blocks earlier than the given date, format must be YYYY-MM-DD (Useful to keep DB size down)")
     parser.add_argument("--blocks-enddate", default="3000-12-31", help="Ignore blocks later than the given date, format must be YYYY-MM-DD (Useful to keep DB size down)")
@@ -66,6 +67,9 @@ if __name__ == "__main__":
     if not args.no_pause:
         atexit.register(lambda: input("\nPress Enter to exit ..."))
 
+    if args.bytes_per_addr is not None and not 1 <= args.bytes_per_addr <= 19:
+        sys.exit("--bytes-per-addr must be between 1 and 19 inclusive")
+
     if not args.update and not args.force and path.exists(args.dbfilename):
         sys.exit("Address database file already exists (use --update to update or --force to overwrite)")
 
@@ -81,4 +85,4 @@ if __name__ == "__main__":
         sys.exit("Can't automatically determine Bitcoin data directory (use --datadir)")
     blockdir = path.join(blockdir, "blocks")
 
-    addressset.create_address_db(args.dbfilename, blockdir, args.dblength, args.blocks_startdate, args.blocks_enddate, args.first_block_file, args.dbyolo, args.addrs_to_text, args.update, progress_bar=not args.no_progress, addresslistfile = args.inputlistfile, multiFile = args.multifileinputlist)
+    addressset.create_address_db(args.dbfilename, blockdir, args.dblength, args.blocks_startdate, args.blocks_enddate, args.first_block_file, args.dbyolo, args.addrs_to_text, args.update, progress_bar=not args.no_progress, addresslistfile = args.inputlistfile, multiFile = args.multifileinputlist, bytes_per_addr = args.bytes_per_addr)